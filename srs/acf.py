@@ -0,0 +1,231 @@
+import numpy as np
+from scipy import fft, signal
+
+from srs.profiling import profiled
+
+# Во сколько раз одна операция БПФ (на элемент и уровень log2) дороже
+# одного умножения-сложения в прямом методе; подобрано замерами np.dot/scipy.fft
+FFT_COST_RATIO = 10
+
+
+def lagged_products(x, max_lag, method='auto'):
+    """
+    Вычисляет суммы произведений со сдвигом S_k = sum_i x_i * x_(i+k)
+
+    Args:
+        x: одномерный массив
+        max_lag: максимальный сдвиг
+        method: 'direct' - скалярное произведение на каждый сдвиг, O(n * max_lag);
+            'fft' - через БПФ с дополнением нулями, O(n log n);
+            'auto' - выбор по оценке объема работы
+    Returns:
+        массив длины max_lag + 1 (для сдвигов >= n значения равны 0)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    if method == 'auto':
+        method = choose_method(n, max_lag)
+
+    result = np.zeros(max_lag + 1)
+    lags = min(max_lag, n - 1) + 1 if n else 0
+    if method == 'direct':
+        for lag in range(lags):
+            result[lag] = np.dot(x[:n - lag], x[lag:])
+    elif method == 'fft':
+        if lags:
+            # Дополнение нулями до n + max_lag исключает циклическое наложение
+            size = fft.next_fast_len(n + lags - 1, real=True)
+            spectrum = fft.rfft(x, size)
+            result[:lags] = fft.irfft(spectrum * np.conj(spectrum), size)[:lags]
+    else:
+        raise ValueError(f"Неизвестный метод: {method}")
+    return result
+
+
+def choose_method(n, max_lag):
+    """Выбирает 'direct' или 'fft' по оценке числа операций"""
+    lags = min(max_lag, max(n - 1, 0)) + 1
+    size = fft.next_fast_len(max(n + lags - 1, 2), real=True)
+    direct_cost = n * lags
+    fft_cost = FFT_COST_RATIO * size * np.log2(size)
+    return 'fft' if fft_cost < direct_cost else 'direct'
+
+
+@profiled(count='sequence')
+def calculate_acf(sequence, max_lag=50, method='auto'):
+    """
+    Вычисляет автокорреляционную функцию для последовательности
+
+    Args:
+        sequence: исследуемая последовательность
+        max_lag: максимальное значение сдвига
+        method: 'direct', 'fft' или 'auto' (см. lagged_products)
+    Returns:
+        acf: массив значений автокорреляции для разных сдвигов
+    """
+    sequence = np.asarray(sequence, dtype=np.float64)
+    n = len(sequence)
+    normalized_seq = (sequence - np.mean(sequence)) / np.std(sequence)
+    return lagged_products(normalized_seq, max_lag, method) / n
+
+
+class StreamingACF:
+    """
+    Потоковый накопитель ACF с памятью O(max_lag)
+
+    Принимает последовательность блоками, переносит между блоками хвост из
+    max_lag значений и хранит суммы, по которым в любой момент можно получить
+    ACF, среднее и дисперсию. Частичные состояния соседних участков
+    (например, из параллельных процессов) объединяются методом merge().
+    """
+
+    def __init__(self, max_lag=50, shift=0.0):
+        """
+        Args:
+            max_lag: максимальный сдвиг
+            shift: значение, вычитаемое из данных перед накоплением; значение,
+                близкое к среднему (например, N / 2), уменьшает ошибки округления
+        """
+        self.max_lag = max_lag
+        self.shift = float(shift)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.products = np.zeros(max_lag + 1)
+        self.head = np.empty(0)
+        self.tail = np.empty(0)
+
+    @profiled(count='chunk')
+    def update(self, chunk):
+        """Добавляет очередной блок последовательности"""
+        values = np.asarray(chunk, dtype=np.float64) - self.shift
+        if len(values):
+            self.merge(self._from_values(values))
+        return self
+
+    def merge(self, other):
+        """
+        Присоединяет состояние участка, непосредственно следующего за текущим
+
+        Returns:
+            self
+        """
+        if other.max_lag != self.max_lag or other.shift != self.shift:
+            raise ValueError("Объединяемые накопители должны иметь одинаковые max_lag и shift")
+        if not other.count:
+            return self
+
+        if self.count and self.max_lag:
+            # Пары, у которых первый элемент в текущем участке, а второй - в other
+            t, h = len(self.tail), len(other.head)
+            cross = signal.convolve(self.tail, other.head[::-1])
+            lags = np.arange(1, min(self.max_lag, t + h - 1) + 1)
+            self.products[lags] += cross[t + h - 1 - lags]
+
+        self.products += other.products
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.head = np.concatenate([self.head, other.head])[:self.max_lag]
+        self.tail = _last(np.concatenate([self.tail, other.tail]), self.max_lag)
+        return self
+
+    @property
+    def mean(self):
+        """Среднее значение накопленной последовательности (NaN, если она пуста)"""
+        return self.total / self.count + self.shift if self.count else np.nan
+
+    @property
+    def variance(self):
+        """Дисперсия (смещенная, как np.var); NaN для пустой последовательности"""
+        if not self.count:
+            return np.nan
+        centered_mean = self.total / self.count
+        return self.total_sq / self.count - centered_mean ** 2
+
+    def acf(self):
+        """
+        ACF накопленной последовательности с той же нормировкой, что и calculate_acf
+        (NaN для пустой последовательности)
+        """
+        n = self.count
+        if not n:
+            return np.full(self.max_lag + 1, np.nan)
+        m = self.total / n
+        k = np.arange(min(self.max_lag, n - 1) + 1)
+
+        # Суммы первых и последних k значений для поправки на среднее
+        head_sums = np.concatenate([[0.0], np.cumsum(self.head)])[k]
+        tail_sums = np.concatenate([[0.0], np.cumsum(self.tail[::-1])])[k]
+        centered = (self.products[k] - m * (2 * self.total - head_sums - tail_sums)
+                    + (n - k) * m ** 2)
+
+        acf = np.zeros(self.max_lag + 1)
+        acf[k] = centered / (n * self.variance)
+        return acf
+
+    @profiled()
+    def result(self):
+        """Значения ACF и сдвиги, выходящие за 95% доверительный интервал"""
+        acf = self.acf()
+        if not self.count:
+            return {
+                'sample_size': 0,
+                'max_lag': self.max_lag,
+                'acf': acf,
+                'confidence_interval': np.nan,
+                'significant_lags': np.zeros(0, dtype=np.intp),
+                'max_abs_acf': np.nan,
+            }
+        confidence_interval = 1.96 / np.sqrt(self.count)
+        significant_lags = np.flatnonzero(np.abs(acf[1:]) > confidence_interval) + 1
+        return {
+            'sample_size': self.count,
+            'max_lag': self.max_lag,
+            'acf': acf,
+            'confidence_interval': confidence_interval,
+            'significant_lags': significant_lags,
+            'max_abs_acf': float(np.max(np.abs(acf[1:]), initial=0.0)),
+        }
+
+    def _from_values(self, values):
+        """Состояние для одного блока (уже сдвинутых) значений"""
+        state = StreamingACF(self.max_lag, self.shift)
+        state.count = len(values)
+        state.total = float(np.sum(values))
+        state.total_sq = float(np.dot(values, values))
+        state.products = lagged_products(values, self.max_lag)
+        state.head = values[:self.max_lag].copy()
+        state.tail = _last(values, self.max_lag).copy()
+        return state
+
+
+def _last(values, count):
+    """Последние count элементов массива (весь массив, если он короче)"""
+    return values[max(len(values) - count, 0):]
+
+
+def calculate_acf_direct(sequence, max_lag=50):
+    """
+    Эталонная реализация ACF: отдельное скалярное произведение на каждый сдвиг
+
+    Args:
+        sequence: исследуемая последовательность
+        max_lag: максимальное значение сдвига
+    Returns:
+        acf: массив значений автокорреляции для разных сдвигов
+    """
+    # Нормализация последовательности
+    sequence = np.array(sequence)
+    n = len(sequence)
+    mean = np.mean(sequence)
+    var = np.var(sequence)
+    normalized_seq = (sequence - mean) / np.sqrt(var)
+
+    # Вычисление ACF для разных сдвигов
+    acf = np.zeros(max_lag + 1)
+    for lag in range(max_lag + 1):
+        # Вычисление корреляции для текущего сдвига
+        acf[lag] = np.sum(normalized_seq[:(n - lag)] * normalized_seq[lag:]) / n
+
+    return acf
@@ -0,0 +1,129 @@
+import numpy as np
+
+# Для N <= 2^32 произведение (N - 1) * (N - 1) + (N - 1) помещается в uint64
+UINT64_SAFE_MODULUS = 2 ** 32
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+_MASK64 = 2 ** 64 - 1
+
+
+class GenericBackend:
+    """Произвольный модуль: целые Python в массивах object"""
+    name = 'generic'
+
+    def __init__(self, N):
+        self.N = N
+        self.dtype = np.uint64 if N <= 2 ** 64 else object
+
+    def encode(self, values):
+        """Список целых Python -> массив во внутреннем представлении"""
+        return np.array(values, dtype=object)
+
+    def decode(self, row):
+        """Внутреннее представление -> значения для массива результата"""
+        return row
+
+    def mul_add(self, x, a, c):
+        """(a * x + c) mod N поэлементно, с транслированием массивов"""
+        return (a * x + c) % self.N
+
+
+class ModularBackend(GenericBackend):
+    """N <= 2^32: uint64 без переполнения, приведение делением с остатком"""
+    name = 'uint64'
+
+    def __init__(self, N):
+        super().__init__(N)
+        self._modulus = np.uint64(N)
+
+    def encode(self, values):
+        return np.array(values, dtype=np.uint64)
+
+    def mul_add(self, x, a, c):
+        return (a * x + c) % self._modulus
+
+
+class PowerOfTwoBackend(GenericBackend):
+    """
+    N = 2^k, k <= 64: умножение uint64 с переполнением дает результат
+    по модулю 2^64, поэтому достаточно маски младших k битов (при k = 64
+    не нужна и она)
+    """
+    name = 'power_of_two'
+
+    def __init__(self, N):
+        super().__init__(N)
+        self._mask = None if N == 2 ** 64 else np.uint64(N - 1)
+
+    def encode(self, values):
+        return np.array(values, dtype=np.uint64)
+
+    def mul_add(self, x, a, c):
+        result = a * x + c
+        if self._mask is not None:
+            result &= self._mask
+        return result
+
+
+class TwoLimbBackend(GenericBackend):
+    """
+    N = 2^k, 64 < k <= 128: значения - пары 64-битных слов (старшее, младшее)
+    в массивах uint64 формы (2, n); умножение по модулю 2^128 собирается из
+    32-битных половин младших слов
+    """
+    name = 'two_limb'
+
+    def __init__(self, N):
+        super().__init__(N)
+        self._high_mask = np.uint64((N >> 64) - 1)
+
+    def encode(self, values):
+        return np.array([[value >> 64 for value in values],
+                         [value & _MASK64 for value in values]], dtype=np.uint64)
+
+    def decode(self, row):
+        return (row[0].astype(object) << 64) | row[1].astype(object)
+
+    def mul_add(self, x, a, c):
+        x_high, x_low = x[0], x[1]
+        a_high, a_low = a[0], a[1]
+
+        # Полное 128-битное произведение младших слов
+        low_high, low = _multiply_64(x_low, a_low)
+        # Старшие слова влияют только на старшее слово результата
+        high = low_high + x_low * a_high + x_high * a_low
+
+        result_low = low + c[1]
+        carry = (result_low < low).astype(np.uint64)
+        result_high = (high + c[0] + carry) & self._high_mask
+        return np.stack(np.broadcast_arrays(result_high, result_low))
+
+
+def _multiply_64(x, y):
+    """Полное произведение 64-битных чисел: (старшее слово, младшее слово)"""
+    x0, x1 = x & _MASK32, x >> _SHIFT32
+    y0, y1 = y & _MASK32, y >> _SHIFT32
+    p00, p01, p10, p11 = x0 * y0, x0 * y1, x1 * y0, x1 * y1
+    middle = (p00 >> _SHIFT32) + (p01 & _MASK32) + (p10 & _MASK32)
+    low = (p00 & _MASK32) | (middle << _SHIFT32)
+    high = p11 + (p01 >> _SHIFT32) + (p10 >> _SHIFT32) + (middle >> _SHIFT32)
+    return high, low
+
+
+def select_backend(N):
+    """
+    Выбор способа вычислений по модулю N
+
+    N = 2^k при k <= 64 - маска на uint64 с переполнением, N <= 2^32 -
+    uint64 с делением с остатком, N = 2^k при k <= 128 - два 64-битных
+    слова, иначе - целые Python.
+    """
+    power_of_two = N & (N - 1) == 0
+    if power_of_two and N <= 2 ** 64:
+        return PowerOfTwoBackend(N)
+    if N <= UINT64_SAFE_MODULUS:
+        return ModularBackend(N)
+    if power_of_two and N <= 2 ** 128:
+        return TwoLimbBackend(N)
+    return GenericBackend(N)
@@ -0,0 +1,193 @@
+import numpy as np
+
+from srs.backends import UINT64_SAFE_MODULUS
+from srs.mcg import MCG
+
+
+class MCGBatch:
+    """
+    Набор независимых генераторов x -> (a x + c) mod N в виде структуры массивов
+
+    Параметры и состояния всех потоков хранятся в массивах NumPy, и один
+    вызов next() продвигает все потоки одним векторным шагом вместо вызова
+    метода у каждого объекта MCG. Значения каждого потока совпадают со
+    значениями MCG с теми же параметрами.
+
+    Если все модули не превышают 2^32, массивы имеют тип uint64 (произведения
+    помещаются без переполнения), иначе - object с целыми Python.
+    """
+
+    def __init__(self, N, a, c, x0, size=None):
+        """
+        Args:
+            N, a, c, x0: параметры потоков - числа (общие для всех потоков)
+                или массивы одинаковой длины
+            size: число потоков, если все параметры заданы числами
+        """
+        shape = np.broadcast_shapes(*(np.shape(value) for value in (N, a, c, x0)))
+        if size is not None:
+            shape = np.broadcast_shapes(shape, (size,))
+        if len(shape) != 1:
+            raise ValueError("Параметры должны быть числами или одномерными массивами")
+
+        params = [np.broadcast_to(np.asarray(value, dtype=object), shape) for value in (N, a, c, x0)]
+        if any(int(value) < 0 for values in params for value in values):
+            raise ValueError("Параметры генератора должны быть неотрицательными")
+        if any(int(value) < 1 for value in params[0]):
+            raise ValueError("Модуль N должен быть положительным")
+
+        wide = any(int(value) > UINT64_SAFE_MODULUS for value in params[0])
+        self.dtype = object if wide else np.uint64
+        self.N = np.array(params[0], dtype=self.dtype)
+        self.a = np.array(params[1], dtype=self.dtype) % self.N
+        self.c = np.array(params[2], dtype=self.dtype) % self.N
+        # Начальные значения хранятся как заданы (как MCG.initial_x0),
+        # текущее состояние - приведенным по модулю N
+        self.initial_x0 = np.array(params[3], dtype=object)
+        self._x0 = np.array(self.initial_x0 % params[0], dtype=self.dtype)
+        self.state = self._x0.copy()
+
+    @classmethod
+    def from_generators(cls, generators):
+        """Набор из отдельных экземпляров MCG (с их текущими состояниями)"""
+        generators = list(generators)
+        batch = cls([g.N for g in generators], [g.a for g in generators],
+                    [g.c for g in generators], [g.initial_x0 for g in generators])
+        batch.state[:] = np.array([g.current % g.N for g in generators], dtype=batch.dtype)
+        return batch
+
+    def __len__(self):
+        return len(self.N)
+
+    def next(self, streams=None):
+        """
+        Продвигает потоки на один шаг
+
+        Args:
+            streams: индексы, срез или маска потоков (по умолчанию - все)
+        Returns:
+            массив новых значений выбранных потоков
+        """
+        index = _select(streams)
+        self.state[index] = (self.a[index] * self.state[index] + self.c[index]) % self.N[index]
+        return self.state[index].copy()
+
+    def get_normalized_next(self, streams=None):
+        """Следующие значения потоков, нормализованные к интервалу [0,1]"""
+        index = _select(streams)
+        return _normalize(self.next(index), self.N[index])
+
+    def generate(self, steps):
+        """
+        Генерирует steps значений каждого потока
+
+        Returns:
+            массив формы (steps, число потоков): строка i - (i + 1)-й вызов next()
+        """
+        out = np.empty((steps, len(self)), dtype=self.dtype)
+        state = self.state
+        for step in range(steps):
+            state = (self.a * state + self.c) % self.N
+            out[step] = state
+        self.state = state
+        return out
+
+    def generate_normalized(self, steps):
+        """То же, что generate(), с нормализацией значений к [0,1]"""
+        return _normalize(self.generate(steps), self.N)
+
+    def reset(self, offset=0, streams=None):
+        """
+        Сброс потоков к начальному состоянию
+
+        Args:
+            offset: число уже выданных элементов (общее или по потокам)
+            streams: индексы, срез или маска потоков (по умолчанию - все)
+        """
+        self.jump(offset, streams)
+
+    def jump(self, n, streams=None):
+        """Переводит потоки в состояние после n шагов от начальных значений x0"""
+        index = _select(streams)
+        self.state[index] = self._advance(self._x0[index], n, index)
+
+    def skip(self, n, streams=None):
+        """Пропускает n следующих элементов относительно текущего состояния потоков"""
+        index = _select(streams)
+        self.state[index] = self._advance(self.state[index], n, index)
+
+    def element_at(self, n, streams=None):
+        """
+        n-е элементы последовательностей потоков (нумерация с 0) без изменения
+        состояния, как MCG.element_at()
+        """
+        index = _select(streams)
+        n = np.asarray(n)
+        if n.dtype.kind in 'iuO' and np.any(n < 0):
+            raise ValueError("Номер элемента не может быть отрицательным")
+        return self._advance(self._x0[index], n + 1, index)
+
+    def generator(self, index):
+        """Экземпляр MCG с параметрами и текущим состоянием потока index"""
+        generator = MCG(int(self.N[index]), int(self.a[index]), int(self.c[index]),
+                        int(self.initial_x0[index]))
+        generator.current = int(self.state[index])
+        return generator
+
+    def _advance(self, x, n, index):
+        """
+        Состояния через n шагов от состояний x выбранных потоков
+
+        Коэффициенты аффинного отображения n шагов вычисляются возведением
+        в степень одновременно для всех потоков; разрядов столько, сколько
+        в наибольшем n.
+        """
+        N, mul_a, mul_c = self.N[index], self.a[index], self.c[index]
+        n = np.broadcast_to(np.asarray(n), np.shape(N))
+        if n.dtype.kind not in 'iuO':
+            raise TypeError("Число шагов должно быть целым")
+        if np.any(n < 0):
+            raise ValueError("Число шагов не может быть отрицательным")
+
+        acc_a = np.ones_like(N)
+        acc_c = np.zeros_like(N)
+        n = n.copy()
+        while np.any(n):
+            bit = (n & 1).astype(bool)
+            acc_a = np.where(bit, acc_a * mul_a % N, acc_a)
+            acc_c = np.where(bit, (mul_a * acc_c + mul_c) % N, acc_c)
+            mul_a, mul_c = mul_a * mul_a % N, (mul_a * mul_c + mul_c) % N
+            n >>= 1
+        return np.asarray((acc_a * x + acc_c) % N, dtype=self.dtype)
+
+
+def _select(streams):
+    """Индекс потоков для массивов параметров (None - все потоки)"""
+    return slice(None) if streams is None else streams
+
+
+def _normalize(values, N):
+    if values.dtype == object:
+        return np.array(values / N, dtype=np.float64)
+    return values.astype(np.float64) / N.astype(np.float64)
+
+
+if __name__ == "__main__":
+    import time
+
+    streams, steps = 100000, 100
+    seeds = np.arange(streams) * 2 + 1
+    batch = MCGBatch(2 ** 31, 11, 0, seeds)
+    generators = [MCG(2 ** 31, 11, 0, int(seed)) for seed in seeds]
+
+    start_time = time.perf_counter()
+    values = batch.generate(steps)
+    batch_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    reference = [[g.next() for g in generators] for _ in range(steps)]
+    loop_time = time.perf_counter() - start_time
+
+    assert np.array_equal(values, np.array(reference, dtype=np.uint64))
+    print(f"{streams} потоков x {steps} шагов: MCGBatch {batch_time:.3f} с, "
+          f"отдельные MCG {loop_time:.3f} с (x{loop_time / batch_time:.0f})")
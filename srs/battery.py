@@ -0,0 +1,133 @@
+import time
+
+import numpy as np
+
+from srs.acf import StreamingACF
+from srs.linear_complexity import LinearComplexityAccumulator
+from srs.mcg import create_generators
+from srs.plane import PlaneAccumulator
+from srs.results import EXTRACTORS, GeneratorParams, from_accumulator, write_jsonl
+from srs.runs import RunsAccumulator
+from srs.series import SeriesCounter
+from srs.uniformity import UniformityAccumulator
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Фабрики потоковых накопителей: каждый принимает блоки значений генератора
+# через update() и возвращает словарь результатов из result()
+TESTS = {
+    'histogram': lambda generator: UniformityAccumulator(generator.N),
+    'acf': lambda generator: StreamingACF(max_lag=50, shift=generator.N / 2),
+    'series': lambda generator: SeriesCounter(k=3),
+    'runs': lambda generator: RunsAccumulator(),
+    'plane': lambda generator: PlaneAccumulator(generator.N),
+    'linear_complexity': lambda generator: LinearComplexityAccumulator(),
+}
+
+
+class TestBattery:
+    """
+    Набор статистических тестов, работающих от одного прохода генерации
+
+    Последовательность генерируется блоками один раз, и каждый блок
+    передается всем включенным накопителям, так что стоимость генерации
+    не зависит от числа тестов.
+    """
+
+    def __init__(self, generator=None, tests=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            generator: экземпляр MCG (по умолчанию - генератор из задания)
+            tests: имена тестов из TESTS или словарь {имя: накопитель}
+                (по умолчанию - все тесты)
+            chunk_size: размер блока генерации
+        """
+        self.generator = generator or create_generators()
+        if tests is None:
+            tests = list(TESTS)
+        if isinstance(tests, dict):
+            self.accumulators = dict(tests)
+        else:
+            self.accumulators = {name: TESTS[name](self.generator) for name in tests}
+        self.chunk_size = chunk_size
+
+    def run(self, length):
+        """
+        Генерирует length значений и передает их всем тестам
+
+        Returns:
+            словарь {имя теста: результаты}, а также время генерации и
+            каждого теста в секундах в разделе 'timing'
+        """
+        timing = dict.fromkeys(self.accumulators, 0.0)
+        generation_time = 0.0
+
+        chunks = self.generator.iter_chunks(self.chunk_size, total=length)
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            generation_time += time.perf_counter() - start
+            if chunk is None:
+                break
+            for name, accumulator in self.accumulators.items():
+                start = time.perf_counter()
+                accumulator.update(chunk)
+                timing[name] += time.perf_counter() - start
+
+        report = {}
+        for name, accumulator in self.accumulators.items():
+            start = time.perf_counter()
+            report[name] = accumulator.result()
+            timing[name] += time.perf_counter() - start
+
+        report['timing'] = {'generation': generation_time, **timing}
+        report['sample_size'] = length
+        return report
+
+    def records(self, report, offset=0):
+        """
+        Результаты run() в виде списка srs.results.TestResult
+
+        Args:
+            report: словарь, возвращенный run()
+            offset: номер первого элемента проверенного участка последовательности
+        """
+        generator = GeneratorParams.from_generator(self.generator, offset)
+        return [from_accumulator(name, accumulator, report[name], report['sample_size'],
+                                 generator, report['timing'][name])
+                for name, accumulator in self.accumulators.items() if name in EXTRACTORS]
+
+
+def format_report(report):
+    """Текстовый отчет по результатам TestBattery.run()"""
+    lines = [f"Результаты батареи тестов (длина последовательности: {report['sample_size']})"]
+    for name, result in report.items():
+        if name in ('timing', 'sample_size'):
+            continue
+        lines.append(f"\n[{name}]")
+        for key, value in result.items():
+            if isinstance(value, np.ndarray):
+                if value.size > 8:
+                    continue
+                value = np.array2string(value, precision=4)
+            elif isinstance(value, float):
+                value = f"{value:.4f}"
+            lines.append(f"  {key}: {value}")
+
+    lines.append("\nВремя выполнения, с:")
+    for name, seconds in report['timing'].items():
+        lines.append(f"  {name}: {seconds:.3f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    battery = TestBattery()
+    report = battery.run(length)
+    print(format_report(report))
+
+    # Второй аргумент - файл JSON Lines, в который дописываются результаты
+    if len(sys.argv) > 2:
+        write_jsonl(battery.records(report), sys.argv[2])
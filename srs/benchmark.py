@@ -0,0 +1,214 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from srs.battery import DEFAULT_CHUNK_SIZE, TESTS
+from srs.mcg import create_generators
+from srs.parallel import generate_parallel
+
+DEFAULT_SIZES = (10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10  # допустимое замедление относительно базового замера
+
+# Поэлементные пути на чистом Python слишком медленны для больших выборок
+_SCALAR_LIMIT = 10 ** 6
+
+# Пики памяти меньше этого значения не сравниваются (шум аллокатора)
+_MEMORY_FLOOR = 1 << 16
+
+
+def _consume_next(generator, size):
+    for _ in range(size):
+        generator.next()
+
+
+def _consume_normalized(generator, size):
+    for _ in range(size):
+        generator.get_normalized_next()
+
+
+def _consume_chunks(generator, size):
+    for _ in generator.iter_chunks(min(DEFAULT_CHUNK_SIZE, size), total=size):
+        pass
+
+
+# Пути генерации: функция (генератор, размер) и максимальный размер выборки
+GENERATION_BENCHMARKS = {
+    'next': (_consume_next, _SCALAR_LIMIT),
+    'get_normalized_next': (_consume_normalized, _SCALAR_LIMIT),
+    'generate_sequence': (lambda generator, size: generator.generate_sequence(size), _SCALAR_LIMIT),
+    'generate_block': (lambda generator, size: generator.generate_block(size), None),
+    'iter_chunks': (_consume_chunks, None),
+    'generate_parallel': (lambda generator, size: generate_parallel(generator, size), None),
+}
+
+
+def _test_benchmark(test):
+    """Прогон выборки через накопитель теста (сама выборка генерируется заранее)"""
+    def run(generator, values):
+        accumulator = TESTS[test](generator)
+        for start in range(0, len(values), DEFAULT_CHUNK_SIZE):
+            accumulator.update(values[start:start + DEFAULT_CHUNK_SIZE])
+        accumulator.result()
+    return run
+
+
+def measure(func, repeat=DEFAULT_REPEAT):
+    """
+    Время и пиковая память вызова func()
+
+    Время - минимум по repeat запускам timeit (наименее зашумленная оценка),
+    память измеряется отдельным запуском под tracemalloc, чтобы трассировка
+    не искажала время.
+
+    Returns:
+        (секунды, пик памяти в байтах)
+    """
+    seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, names=None, repeat=DEFAULT_REPEAT, verbose=True):
+    """
+    Замеры всех путей генерации и всех тестов из srs.battery.TESTS
+
+    Args:
+        sizes: размеры выборок
+        names: имена замеров (по умолчанию - все); имена тестов
+            имеют вид 'test:<имя>'
+        repeat: число повторов для оценки времени
+        verbose: печатать каждый замер
+    Returns:
+        список словарей (name, size, seconds, values_per_second, peak_memory)
+    """
+    benchmarks = {name: (func, limit, False) for name, (func, limit) in GENERATION_BENCHMARKS.items()}
+    benchmarks.update({f'test:{test}': (_test_benchmark(test), None, True) for test in TESTS})
+    if names is not None:
+        unknown = set(names) - set(benchmarks)
+        if unknown:
+            raise ValueError(f"Неизвестные замеры: {', '.join(sorted(unknown))}")
+        benchmarks = {name: benchmarks[name] for name in names}
+
+    results = []
+    for size in sizes:
+        values = None
+        for name, (func, limit, needs_values) in benchmarks.items():
+            if limit is not None and size > limit:
+                continue
+            generator = create_generators()
+            if needs_values:
+                if values is None:
+                    values = generator.generate_block(size)
+                seconds, peak = measure(lambda: func(generator, values), repeat)
+            else:
+                seconds, peak = measure(lambda: _from_start(func, generator, size), repeat)
+            record = {
+                'name': name,
+                'size': size,
+                'seconds': seconds,
+                'values_per_second': size / seconds,
+                'peak_memory': peak,
+            }
+            results.append(record)
+            if verbose:
+                print(_format_record(record))
+    return results
+
+
+def _from_start(func, generator, size):
+    """Каждый повтор начинается с того же состояния генератора"""
+    generator.reset()
+    func(generator, size)
+
+
+def _format_record(record):
+    return (f"{record['name']:<24} n={record['size']:<10} {record['seconds']:10.4f} с "
+            f"{record['values_per_second'] / 1e6:10.2f} млн знач./с "
+            f"{record['peak_memory'] / 2 ** 20:8.1f} МиБ")
+
+
+def save_results(results, path):
+    """Сохраняет замеры в JSON вместе с описанием окружения"""
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)['results']
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Сравнение замеров с базовыми
+
+    Args:
+        results: текущие замеры
+        baseline: базовые замеры (из load_results)
+        threshold: допустимый относительный рост времени и памяти
+    Returns:
+        список (name, size, отношение времени, отношение памяти, регрессия)
+        для замеров, присутствующих в обоих наборах
+    """
+    reference = {(record['name'], record['size']): record for record in baseline}
+    rows = []
+    for record in results:
+        base = reference.get((record['name'], record['size']))
+        if base is None:
+            continue
+        time_ratio = record['seconds'] / base['seconds']
+        memory_ratio = max(record['peak_memory'], _MEMORY_FLOOR) / max(base['peak_memory'], _MEMORY_FLOOR)
+        regression = time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+        rows.append((record['name'], record['size'], time_ratio, memory_ratio, regression))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности генератора и тестов")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="размеры выборок")
+    parser.add_argument('--only', nargs='+', help="имена замеров (например, next test:acf)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="число повторов")
+    parser.add_argument('--output', help="файл JSON для сохранения замеров")
+    parser.add_argument('--compare', help="файл JSON с базовыми замерами")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое относительное замедление (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.only, args.repeat)
+    if args.output:
+        save_results(results, args.output)
+
+    if not args.compare:
+        return 0
+    rows = compare(results, load_results(args.compare), args.threshold)
+    print(f"\nСравнение с {args.compare} (порог {args.threshold:.0%}):")
+    for name, size, time_ratio, memory_ratio, regression in rows:
+        flag = "  РЕГРЕССИЯ" if regression else ""
+        print(f"{name:<24} n={size:<10} время x{time_ratio:.2f}, память x{memory_ratio:.2f}{flag}")
+    regressions = sum(row[4] for row in rows)
+    print(f"Регрессий: {regressions} из {len(rows)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
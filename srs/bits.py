@@ -0,0 +1,69 @@
+import numpy as np
+
+from srs.profiling import profiled
+
+
+def bit_window(values, width=31, shift=0):
+    """
+    Выделяет из каждого числа окно из width битов, начиная с бита shift
+
+    При shift=0 берутся младшие биты, при shift=high_bit_shift(N, width) - старшие.
+
+    Returns:
+        массив np.uint64
+    """
+    if not 1 <= width <= 64:
+        raise ValueError("Ширина окна должна быть от 1 до 64 битов")
+    window = np.asarray(values).astype(np.uint64, copy=False)
+    if shift:
+        window = window >> np.uint64(shift)
+    if width < 64:
+        window = window & np.uint64((1 << width) - 1)
+    return window
+
+
+def high_bit_shift(N, width):
+    """Сдвиг, при котором окно из width битов содержит старшие биты чисел из [0, N)"""
+    return max((N - 1).bit_length() - width, 0)
+
+
+@profiled(count='values')
+def unpack_bits(values, width=31, shift=0, bitorder='big'):
+    """
+    Преобразует последовательность чисел в поток битов без строкового форматирования
+
+    Args:
+        values: массив чисел (например, результат MCG.generate_block)
+        width: число битов, берущихся из каждого числа
+        shift: номер младшего бита окна
+        bitorder: 'big' - от старшего бита к младшему (как format(num, '031b')),
+            'little' - от младшего к старшему
+    Returns:
+        массив np.uint8 из 0 и 1 длины len(values) * width
+    """
+    window = bit_window(values, width, shift)
+    # Наименьший беззнаковый тип, вмещающий окно
+    itemsize = next(size for size in (1, 2, 4, 8) if 8 * size >= width)
+    if bitorder == 'big':
+        raw = window.astype(f'>u{itemsize}').view(np.uint8).reshape(-1, itemsize)
+        bits = np.unpackbits(raw, axis=1)[:, 8 * itemsize - width:]
+    elif bitorder == 'little':
+        raw = window.astype(f'<u{itemsize}').view(np.uint8).reshape(-1, itemsize)
+        bits = np.unpackbits(raw, axis=1, bitorder='little')[:, :width]
+    else:
+        raise ValueError("bitorder должен быть 'big' или 'little'")
+    return bits.reshape(-1)
+
+
+@profiled(count='values')
+def pack_bits(values, width=31, shift=0, bitorder='big'):
+    """
+    Упакованный поток битов: по 8 битов потока в байте (первый бит - старший)
+
+    Параметры те же, что у unpack_bits. Длина потока в битах равна
+    len(values) * width, последний байт дополняется нулями.
+
+    Returns:
+        массив np.uint8
+    """
+    return np.packbits(unpack_bits(values, width, shift, bitorder))
@@ -0,0 +1,187 @@
+import random
+from itertools import chain
+
+import numpy as np
+
+from srs.mcg import DEFAULT_BLOCK_SIZE, MCG, create_generators
+
+DEFAULT_BUFFER_SIZE = DEFAULT_BLOCK_SIZE * 16
+
+# Число значащих битов float64: при N > 2^53 частное x / N может округлиться до 1.0
+_FLOAT_BITS = 53
+
+
+class BufferedMCG(MCG):
+    """
+    MCG с буфером заранее вычисленных значений
+
+    Значения вычисляются блоками через векторную генерацию (как generate_block)
+    и выдаются из списка итератором, поэтому next() и get_normalized_next()
+    не выполняют арифметику на уровне интерпретатора: это связанные методы
+    __next__ встроенных итераторов, переустанавливаемые при каждом сбросе.
+    Последовательность совпадает с MCG: current - последнее выданное значение,
+    а его изменение (в том числе через reset(), jump(), skip()) сбрасывает буфер.
+    """
+
+    def __init__(self, N, a, c, x0, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            N, a, c, x0: параметры генератора, как у MCG
+            buffer_size: число значений, вычисляемых за одно заполнение буфера
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size должен быть положительным")
+        self.buffer_size = buffer_size
+        super().__init__(N, a, c, x0)
+
+    @classmethod
+    def from_generator(cls, generator, buffer_size=DEFAULT_BUFFER_SIZE):
+        """Буферизованная копия генератора с его текущим состоянием"""
+        buffered = cls(generator.N, generator.a, generator.c, generator.initial_x0, buffer_size)
+        buffered.current = generator.current
+        return buffered
+
+    @property
+    def current(self):
+        """Последнее выданное значение (состояние генератора)"""
+        position = len(self._values) - self._iterator.__length_hint__()
+        if position:
+            return self._values[position - 1]
+        return self._base
+
+    @current.setter
+    def current(self, value):
+        self._base = value
+        self._values = []
+        self._iterator = iter(self._values)
+        stream = chain.from_iterable(self._blocks())
+        # Деление целых Python, как в MCG.get_normalized_next(): x / N
+        self.next = stream.__next__
+        self.get_normalized_next = map(self.N.__rtruediv__, stream).__next__
+
+    def __getstate__(self):
+        # next и get_normalized_next - методы итераторов по буферу, которые
+        # не сериализуются: копия строится заново по параметрам и состоянию
+        return (self.N, self.a, self.c, self.initial_x0, self.current, self.buffer_size)
+
+    def __setstate__(self, state):
+        N, a, c, x0, current, buffer_size = state
+        self.__init__(N, a, c, x0, buffer_size)
+        self.current = current
+
+    def _blocks(self):
+        """Бесконечная последовательность итераторов по заполненным буферам"""
+        while True:
+            base = self.current
+            block = np.empty(self.buffer_size, dtype=self._backend.dtype)
+            self._fill_block(base, block, DEFAULT_BLOCK_SIZE)
+            self._base = base
+            self._values = block.tolist()
+            self._iterator = iter(self._values)
+            yield self._iterator
+
+
+class MCGRandom(random.Random):
+    """
+    Источник случайных чисел для модуля random на основе MCG
+
+    Все методы random.Random (randrange, choice, shuffle, gauss и т.д.)
+    работают поверх буферизованного генератора. random() возвращает x / N,
+    т.е. имеет разрешение 1 / N (для генератора из задания - 2^-31; при
+    N > 2^53 - из 53 старших битов, чтобы результат был строго меньше 1), а
+    getrandbits() собирается из старших битов значений: младшие биты
+    генераторов со степенью двойки в модуле имеют короткий период.
+    seed(n) переводит генератор на n-й элемент последовательности.
+    """
+
+    VERSION = 'mcg-1'
+
+    def __init__(self, x=None, generator=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            x: начальное смещение в последовательности (см. seed); при x=None
+                генератор продолжает с текущего состояния generator
+            generator: экземпляр MCG (по умолчанию - генератор из задания);
+                используются его параметры и текущее состояние
+            buffer_size: размер буфера BufferedMCG
+        """
+        generator = generator or create_generators()
+        self._bind(BufferedMCG.from_generator(generator, buffer_size))
+        # random.Random.__init__ вызывает seed(x), а seed(None) сбросил бы
+        # генератор в начало последовательности
+        super().__init__(x)
+        if x is None:
+            self.generator.current = generator.current
+
+    def _bind(self, generator):
+        self.generator = generator
+        N = generator.N
+        # Число старших битов, которые берутся из каждого значения
+        self._bits = max(N.bit_length() - 1, 1)
+        self._power_of_two = N & (N - 1) == 0
+        self._wide = N > 2 ** _FLOAT_BITS
+
+    def seed(self, a=None, version=2):
+        """
+        Переводит генератор в начало последовательности (a=None) или на a-й
+        элемент (a - неотрицательное целое). Генератор не использует энтропию
+        системы: при a=None последовательность воспроизводима.
+        """
+        if a is None:
+            a = 0
+        if not isinstance(a, int) or a < 0:
+            raise TypeError("Начальное значение MCGRandom - неотрицательное целое (смещение)")
+        self.generator.reset(a)
+        self.gauss_next = None
+
+    def random(self):
+        """Следующее число из [0, 1)"""
+        if self._wide:
+            return self.getrandbits(_FLOAT_BITS) * 2.0 ** -_FLOAT_BITS
+        return self.generator.get_normalized_next()
+
+    def getrandbits(self, k):
+        """Целое из k случайных битов (старшие биты последовательных значений)"""
+        if k < 0:
+            raise ValueError("Число битов не может быть отрицательным")
+        if k <= self._bits and self._power_of_two:
+            return self.generator.next() >> (self._bits - k)
+        result, filled = 0, 0
+        while filled < k:
+            take = min(self._bits, k - filled)
+            value = self.generator.next()
+            if not self._power_of_two:
+                # Значения из [2^bits, N) отбрасываются, чтобы биты были равновероятны
+                while value >> self._bits:
+                    value = self.generator.next()
+            result = (result << take) | (value >> (self._bits - take))
+            filled += take
+        return result
+
+    def getstate(self):
+        generator = self.generator
+        return (self.VERSION, generator.N, generator.a, generator.c, generator.initial_x0,
+                generator.current, self.gauss_next)
+
+    def setstate(self, state):
+        version, N, a, c, x0, current, gauss_next = state
+        if version != self.VERSION:
+            raise ValueError(f"Состояние версии {version!r} не поддерживается")
+        generator = BufferedMCG(N, a, c, x0, self.generator.buffer_size)
+        generator.current = current
+        self._bind(generator)
+        self.gauss_next = gauss_next
+
+
+if __name__ == "__main__":
+    import timeit
+
+    count = 10 ** 6
+    for name, generator in [('MCG', create_generators()),
+                            ('BufferedMCG', BufferedMCG.from_generator(create_generators()))]:
+        seconds = timeit.timeit(generator.next, number=count)
+        print(f"{name}.next(): {count / seconds / 1e6:.2f} млн знач./с")
+
+    rng = MCGRandom(2024)
+    print(f"\nMCGRandom(2024): random() = {rng.random():.6f}, randint(1, 6) = {rng.randint(1, 6)}, "
+          f"choice = {rng.choice('абвгд')}, gauss = {rng.gauss(0, 1):.4f}")
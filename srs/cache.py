@@ -0,0 +1,203 @@
+import hashlib
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
+
+from srs.mcg import MCG, create_generators
+from srs.profiling import profiled
+
+# Заголовок файла: сигнатура, ключ (N, a, c, x0, offset, length),
+# CRC32 данных и CRC32 самого заголовка
+MAGIC = b'MCGSEQ01'
+HEADER = struct.Struct('<8s6QII')
+
+DEFAULT_CACHE_DIR = os.environ.get('MCG_CACHE_DIR',
+                                   os.path.join(tempfile.gettempdir(), 'mcg_cache'))
+DEFAULT_MAX_BYTES = 1 << 30  # 1 ГиБ
+
+_WRITE_CHUNK = 1 << 20
+
+
+class SequenceCache:
+    """
+    Дисковый кэш сгенерированных последовательностей в формате raw uint32
+
+    Последовательность идентифицируется ключом (N, a, c, x0, offset, length)
+    и читается обратно через numpy.memmap. Объем кэша ограничен max_bytes,
+    при превышении удаляются давно не использованные файлы (LRU по mtime).
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, generator, length, offset=0):
+        """Последовательность генератора (от x0) начиная с элемента offset"""
+        return self.sequence(generator.N, generator.a, generator.c,
+                             generator.initial_x0, length, offset)
+
+    def sequence(self, N, a, c, x0, length, offset=0):
+        """
+        Возвращает элементы offset..offset+length-1 последовательности
+        MCG(N, a, c, x0), генерируя и сохраняя их при отсутствии в кэше
+
+        Returns:
+            numpy.memmap только для чтения с dtype uint32
+        """
+        key = self._key(N, a, c, x0, offset, length)
+        cached = self.get(*key)
+        if cached is not None:
+            return cached
+        return self._put(key)
+
+    def get(self, N, a, c, x0, offset, length, verify=False):
+        """
+        Читает последовательность из кэша
+
+        Args:
+            verify: дополнительно сверить CRC32 данных (читает весь файл)
+        Returns:
+            numpy.memmap или None, если файла нет или он устарел/поврежден
+        """
+        key = self._key(N, a, c, x0, offset, length)
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(HEADER.size)
+        except FileNotFoundError:
+            return None
+
+        data_crc = self._check_header(header, key, os.path.getsize(path))
+        if data_crc is None:
+            self._remove(path)
+            return None
+
+        data = self._open(path, length)
+        if verify and zlib.crc32(data) != data_crc:
+            del data
+            self._remove(path)
+            return None
+
+        # Отмечаем использование для LRU-вытеснения
+        os.utime(path)
+        return data
+
+    def clear(self):
+        """Удаляет все файлы кэша"""
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+    def total_bytes(self):
+        """Суммарный размер файлов кэша"""
+        return sum(size for _, size, _ in self._entries())
+
+    def _put(self, key):
+        """Генерирует последовательность блоками прямо в файл и вытесняет старые"""
+        N, a, c, x0, offset, length = key
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, *key, 0, 0))
+                generator = MCG(N=N, a=a, c=c, x0=x0)
+                generator.jump(offset)
+                data_crc = 0
+                for chunk in generator.iter_chunks(_WRITE_CHUNK, total=length):
+                    raw = chunk.astype(np.uint32).tobytes()
+                    data_crc = zlib.crc32(raw, data_crc)
+                    f.write(raw)
+                f.seek(0)
+                f.write(self._pack_header(key, data_crc))
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self._evict(keep=path)
+        return self._open(path, length)
+
+    def _evict(self, keep):
+        """Удаляет давно не использованные файлы, пока кэш не уложится в лимит"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                self._remove(path)
+                total -= size
+
+    def _entries(self):
+        """Список (путь, размер, время последнего использования) файлов кэша"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.u32'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, f'{digest}.u32')
+
+    @staticmethod
+    def _key(N, a, c, x0, offset, length):
+        key = tuple(int(value) for value in (N, a, c, x0, offset, length))
+        if N > 2 ** 32:
+            raise ValueError("Кэш хранит значения в uint32, требуется N <= 2^32")
+        if any(value < 0 or value >= 2 ** 64 for value in key):
+            raise ValueError("Параметры ключа должны помещаться в uint64")
+        return key
+
+    @staticmethod
+    def _pack_header(key, data_crc):
+        body = HEADER.pack(MAGIC, *key, data_crc, 0)[:-4]
+        return body + struct.pack('<I', zlib.crc32(body))
+
+    @staticmethod
+    def _check_header(header, key, file_size):
+        """Возвращает CRC32 данных или None, если заголовок не соответствует ключу"""
+        if len(header) != HEADER.size:
+            return None
+        magic, *stored_key, data_crc, header_crc = HEADER.unpack(header)
+        if magic != MAGIC or zlib.crc32(header[:-4]) != header_crc:
+            return None
+        if tuple(stored_key) != key or file_size != HEADER.size + 4 * key[-1]:
+            return None
+        return data_crc
+
+    @staticmethod
+    def _open(path, length):
+        if length == 0:
+            return np.empty(0, dtype=np.uint32)
+        return np.memmap(path, dtype=np.uint32, mode='r', offset=HEADER.size, shape=(length,))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+_default_cache = None
+
+
+@profiled(count='length')
+def cached_sequence(length, generator=None, offset=0):
+    """
+    Последовательность генератора из задания (или переданного generator)
+    через общий кэш в каталоге MCG_CACHE_DIR
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SequenceCache()
+    return _default_cache.load(generator or create_generators(), length, offset)
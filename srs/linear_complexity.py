@@ -0,0 +1,161 @@
+import numpy as np
+
+from srs.bits import unpack_bits
+from srs.profiling import profiled
+
+
+# Длина LFSR, начиная с которой многочлены связи хранятся в массивах uint64:
+# операции над длинными целыми Python дороже вызовов NumPy; подобрано замерами
+WORD_THRESHOLD = 1 << 15
+
+# Запас битов окна сверх необходимых L + 1, после которого окно обрезается
+_WINDOW_SLACK = 64
+
+
+@profiled(count='bits')
+def linear_complexity_profile(bits):
+    """
+    Профиль линейной сложности за один проход алгоритма Берлекампа-Мэсси
+
+    После обработки i-го бита длина L текущего LFSR равна линейной сложности
+    префикса длины i, поэтому весь профиль получается за один проход.
+    Многочлены связи хранятся как битово упакованные целые Python, а после
+    того как L превысит WORD_THRESHOLD - как массивы слов uint64, так что
+    невязка и обновление вычисляются операциями XOR/AND над машинными словами.
+
+    Args:
+        bits: последовательность битов 0/1
+    Returns:
+        массив np.int64: profile[i] - линейная сложность первых i + 1 битов
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n = len(bits)
+    profile = np.empty(n, dtype=np.int64)
+    # Бит k - бит s_(n-1-k): окно s_i, s_(i-1), ... начинается с бита n - 1 - i
+    history = np.packbits(bits[::-1], bitorder='little').tobytes() + bytes(8)
+
+    c, b = 1, 1  # текущий и предыдущий многочлены связи (бит j - коэффициент при x^j)
+    # Бит j окна равен s_(i-j); достоверны младшие kept битов. Читаются только
+    # биты до deg c <= L, поэтому окно обрезается до L + 1 битов, а при росте L
+    # недостающие биты берутся из history
+    window, kept = 0, 0
+    L, m = 0, -1
+    L_b = 0  # L на момент сохранения b (deg b <= L_b)
+
+    values = bits.tolist()
+    for i in range(n):
+        if L >= WORD_THRESHOLD:
+            _profile_words(history, n, i, c, b, L, L_b, m, profile)
+            break
+        window = (window << 1) | values[i]
+        kept += 1
+        if kept > L + 1 + _WINDOW_SLACK:
+            window &= (1 << (L + 1)) - 1
+            kept = L + 1
+        # Невязка: s_i + sum c_j * s_(i-j) по модулю 2
+        if (c & window).bit_count() & 1:
+            t = c
+            c ^= b << (i - m)
+            if 2 * L <= i:
+                L, L_b = i + 1 - L, L
+                m = i
+                b = t
+                if kept < L + 1:
+                    window = _window(history, n, i, L + 1)
+                    kept = L + 1
+        profile[i] = L
+
+    return profile
+
+
+def _window(history, n, i, width):
+    """Биты s_i, s_(i-1), ..., s_(i-width+1) как целое (бит j - s_(i-j))"""
+    position = n - 1 - i
+    first = position >> 3
+    value = int.from_bytes(history[first:first + (width >> 3) + 2], 'little') >> (position & 7)
+    return value & ((1 << width) - 1)
+
+
+def _profile_words(history, n, start, c, b, L, L_b, m, profile):
+    """
+    Продолжение алгоритма Берлекампа-Мэсси с шага start на массивах uint64
+
+    Окно s_i, s_(i-1), ... - срез одной из 64 копий history, сдвинутых на
+    0..63 бита, поэтому невязка - AND и XOR-свертка deg c / 64 слов.
+    """
+    words = n // 64 + 4
+    to_words = lambda value: np.frombuffer(value.to_bytes(words * 8, 'little'), dtype=np.uint64)
+    history = int.from_bytes(history, 'little')
+    shifted = np.empty((64, words), dtype=np.uint64)
+    for r in range(64):
+        shifted[r] = to_words(history >> r)
+    c, b = to_words(c).copy(), to_words(b)
+
+    for i in range(start, n):
+        position = n - 1 - i
+        used = (L >> 6) + 1
+        first = position >> 6
+        window = shifted[position & 63, first:first + used]
+        if int(np.bitwise_xor.reduce(c[:used] & window)).bit_count() & 1:
+            t = c.copy() if 2 * L <= i else None
+            # c ^= b << (i - m) по словам
+            word_shift, bit_shift = divmod(i - m, 64)
+            size = (L_b >> 6) + 1
+            if bit_shift:
+                c[word_shift:word_shift + size] ^= b[:size] << np.uint64(bit_shift)
+                c[word_shift + 1:word_shift + size + 1] ^= b[:size] >> np.uint64(64 - bit_shift)
+            else:
+                c[word_shift:word_shift + size] ^= b[:size]
+            if t is not None:
+                L, L_b = i + 1 - L, L
+                m = i
+                b = t
+        profile[i] = L
+
+
+def linear_complexity(bits):
+    """Линейная сложность всей последовательности битов"""
+    profile = linear_complexity_profile(bits)
+    return int(profile[-1]) if len(profile) else 0
+
+
+class LinearComplexityAccumulator:
+    """
+    Накопитель битов для профиля линейной сложности
+
+    Алгоритм Берлекампа-Мэсси последователен, поэтому накапливаются
+    только первые max_bits битов потока, а профиль строится в result()
+    """
+
+    def __init__(self, max_bits=10000, width=31):
+        """
+        Args:
+            max_bits: число битов, по которым строится профиль
+            width: число младших битов, берущихся из каждого числа
+        """
+        self.max_bits = max_bits
+        self.width = width
+        self._chunks = []
+        self._collected = 0
+
+    @profiled(count='values')
+    def update(self, values):
+        """Добавляет биты очередного блока, пока не набрано max_bits"""
+        needed = self.max_bits - self._collected
+        if needed > 0:
+            numbers = -(-needed // self.width)
+            bits = unpack_bits(values[:numbers], self.width)[:needed]
+            self._chunks.append(bits)
+            self._collected += len(bits)
+        return self
+
+    def result(self):
+        bits = np.concatenate(self._chunks) if self._chunks else np.zeros(0, dtype=np.uint8)
+        profile = linear_complexity_profile(bits)
+        ideal = np.arange(1, len(profile) + 1) / 2
+        return {
+            'bits': len(bits),
+            'profile': profile,
+            'linear_complexity': int(profile[-1]) if len(profile) else 0,
+            'mean_deviation': float(np.mean(np.abs(profile - ideal))) if len(profile) else 0.0,
+        }
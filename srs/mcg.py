@@ -1,3 +1,17 @@
+import warnings
+
+import numpy as np
+
+from srs.backends import TwoLimbBackend, select_backend
+from srs.profiling import profiled
+
+# Ширина блока (число "дорожек"), которые продвигаются за один векторный шаг
+DEFAULT_BLOCK_SIZE = 4096
+
+# Модули, для которых разложение на множители в period() занимает доли миллисекунды
+CHEAP_PERIOD_MODULUS = 2 ** 32
+
+
 class MCG:
     def __init__(self, N, a, c, x0):
         """
@@ -12,20 +26,267 @@ class MCG:
         self.c = c
         self.current = x0
         self.initial_x0 = x0
+        self._lane_cache = {}
+        self._cycle = None
+        # Способ вычислений выбирается по модулю один раз (см. srs.backends);
+        # для N = 2^k приведение по модулю заменяется маской
+        self._backend = select_backend(N)
+        self._mask = N - 1 if N & (N - 1) == 0 else None
 
     def next(self):
         """Генерирует следующее число в последовательности"""
-        self.current = (self.a * self.current + self.c) % self.N
+        if self._mask is not None:
+            self.current = (self.a * self.current + self.c) & self._mask
+        else:
+            self.current = (self.a * self.current + self.c) % self.N
         return self.current
 
-    def reset(self):
-        """Сброс генератора к начальному состоянию"""
-        self.current = self.initial_x0
+    def reset(self, offset=0):
+        """
+        Сброс генератора к начальному состоянию
 
-    def generate_sequence(self, length):
-        """Генерирует последовательность заданной длины"""
+        Args:
+            offset: число уже выданных элементов; следующий вызов next()
+                вернет element_at(offset)
+        """
+        self.jump(offset)
+
+    def jump(self, n):
+        """Переводит генератор в состояние после n шагов от начального значения x0"""
+        self.current = self._advance(self.initial_x0, n)
+
+    def skip(self, n):
+        """Пропускает n следующих элементов относительно текущего состояния"""
+        self.current = self._advance(self.current, n)
+
+    def element_at(self, n):
+        """
+        Возвращает n-й элемент последовательности (нумерация с 0) без
+        изменения состояния генератора, т.е. значение, которое вернет
+        (n + 1)-й вызов next() после reset()
+        """
+        if n < 0:
+            raise ValueError("Номер элемента не может быть отрицательным")
+        return self._advance(self.initial_x0, n + 1)
+
+    def _affine_power(self, n):
+        """
+        Коэффициенты (A, C) отображения x -> (A * x + C) mod N, равного n шагам
+        генератора. Вычисляются возведением в степень за O(log n) умножений.
+        """
+        if n < 0:
+            raise ValueError("Число шагов не может быть отрицательным")
+        if self.c == 0:
+            return pow(self.a, n, self.N), 0
+
+        # Композиция аффинных отображений: (A2, C2) o (A1, C1) = (A2*A1, A2*C1 + C2)
+        acc_a, acc_c = 1, 0
+        mul_a, mul_c = self.a % self.N, self.c % self.N
+        while n:
+            if n & 1:
+                acc_a, acc_c = acc_a * mul_a % self.N, (mul_a * acc_c + mul_c) % self.N
+            mul_a, mul_c = mul_a * mul_a % self.N, (mul_a * mul_c + mul_c) % self.N
+            n >>= 1
+        return acc_a, acc_c
+
+    def _advance(self, x, n):
+        """Состояние через n шагов от состояния x"""
+        mul, add = self._affine_power(n)
+        if n == 0:
+            # Как и исходный reset(), сохраняем x0 без приведения по модулю
+            return x
+        return (mul * x + add) % self.N
+
+    @profiled(count='length')
+    def generate_sequence(self, length, check_period=None):
+        """
+        Генерирует последовательность заданной длины
+
+        Args:
+            check_period: предупреждать, если length больше числа различных
+                значений последовательности (см. _check_length)
+        """
+        self._check_length(length, check_period, stacklevel=4)
         return [self.next() for _ in range(length)]
 
+    def period(self):
+        """
+        Длины предпериода и периода последовательности от x0 (см. srs.period)
+
+        Вычисляются аналитически, без генерации значений. Для модулей, отличных
+        от степени двойки, требуется разложение N на множители. Результат
+        запоминается: после явного вызова period() методы generate_* проверяют длину
+        запроса по периоду при любом N.
+
+        Returns:
+            CycleStructure(preperiod, period)
+        """
+        if self._cycle is None:
+            from srs.period import sequence_period
+            self._cycle = sequence_period(self.N, self.a, self.c, self.initial_x0)
+        return self._cycle
+
+    def _check_length(self, length, check_period=None, stacklevel=3):
+        """
+        Предупреждает, если запрошено больше значений, чем различных значений в орбите x0
+
+        Args:
+            check_period: True - проверять всегда (для составного N это может
+                потребовать долгого разложения на множители), False - никогда,
+                None - только если период уже известен или вычисляется быстро
+                (N = 2^k или N <= CHEAP_PERIOD_MODULUS)
+            stacklevel: уровень кадра вызывающего кода для warnings.warn
+                (для методов с декоратором profiled на один больше - обертка
+                добавляет свой кадр)
+        """
+        if check_period is None:
+            check_period = (self._cycle is not None or self._mask is not None
+                            or self.N <= CHEAP_PERIOD_MODULUS)
+        if not check_period:
+            return
+        preperiod, period = self.period()
+        distinct = max(preperiod - 1, 0) + period
+        if length > distinct:
+            warnings.warn(f"Запрошено {length} значений, но последовательность содержит "
+                          f"не более {distinct} различных значений (период {period})",
+                          RuntimeWarning, stacklevel=stacklevel)
+
+    @profiled(count='length')
+    def generate_block(self, length, block_size=DEFAULT_BLOCK_SIZE, out=None, check_period=None):
+        """
+        Генерирует последовательность заданной длины в виде массива NumPy uint64
+
+        Результат совпадает с последовательными вызовами next(), состояние
+        генератора продвигается так же.
+
+        Args:
+            length: длина последовательности
+            block_size: число значений, вычисляемых за один векторный шаг
+                (больше - быстрее, но требует больше памяти)
+            out: необязательный массив длины length для записи результата
+            check_period: проверка длины по периоду (см. _check_length)
+        Returns:
+            массив np.uint64 длины length (для N > 2^64 - массив целых Python)
+        """
+        if block_size < 1:
+            raise ValueError("block_size должен быть положительным")
+        if out is None:
+            out = np.empty(length, dtype=self._backend.dtype)
+        elif len(out) != length:
+            raise ValueError("Длина out не совпадает с length")
+        self._check_length(length, check_period, stacklevel=4)
+        if length:
+            self.current = self._fill_block(self.current, out, block_size)
+        return out
+
+    def iter_chunks(self, chunk_size=DEFAULT_BLOCK_SIZE * 16, total=None,
+                    block_size=DEFAULT_BLOCK_SIZE, check_period=None):
+        """
+        Потоковая генерация блоками фиксированного размера с ограниченной памятью
+
+        Каждый блок записывается в один и тот же заранее выделенный буфер,
+        поэтому при необходимости сохранить блок его нужно скопировать.
+
+        Args:
+            chunk_size: размер блока
+            total: общее число значений (None - бесконечный поток)
+            block_size: ширина векторного шага внутри блока
+            check_period: проверка total по периоду (см. _check_length)
+        Yields:
+            массив np.uint64 длины chunk_size (последний блок может быть короче)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным")
+        if total is not None:
+            self._check_length(total, check_period)
+        buffer = np.empty(chunk_size, dtype=self._backend.dtype)
+        remaining = total
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = buffer[:size]
+            self.generate_block(size, block_size, out=chunk, check_period=False)
+            if remaining is not None:
+                remaining -= size
+            yield chunk
+
+    def __iter__(self):
+        """Бесконечный итератор по значениям генератора (эквивалентно next())"""
+        while True:
+            yield self.next()
+
+    def _lane_multipliers(self, width):
+        """
+        Коэффициенты A_k = a^k mod N и C_k = c(a^(k-1) + ... + 1) mod N
+        для k = 1..width, так что x_(i+k) = (A_k * x_i + C_k) mod N
+        """
+        cached = self._lane_cache.get(width)
+        if cached is not None:
+            return cached
+
+        multipliers = [0] * width
+        increments = [0] * width
+        mul, add = 1, 0
+        for k in range(width):
+            mul = mul * self.a % self.N
+            add = (add * self.a + self.c) % self.N
+            multipliers[k] = mul
+            increments[k] = add
+
+        cached = (self._backend.encode(multipliers), self._backend.encode(increments))
+        self._lane_cache[width] = cached
+        return cached
+
+    def _fill_block(self, x, out, block_size):
+        """
+        Заполняет out значениями, следующими за состоянием x, и возвращает
+        последнее из них (новое состояние). Сам генератор не изменяется.
+
+        Двумерный out формы (2, length) заполняется 64-битными словами
+        (старшее, младшее) без преобразования в целые Python (для N = 2^k,
+        64 < k <= 128).
+        """
+        length = out.shape[-1]
+        width = min(block_size, length)
+        multipliers, increments = self._lane_multipliers(width)
+        backend = self._backend
+        step_a, step_c = multipliers[..., -1:], increments[..., -1:]
+        store = backend.decode if out.ndim == 1 else np.asarray
+
+        # Первая строка дорожек: x_1..x_width, далее каждая строка сдвигается
+        # на width шагов одним векторным умножением
+        row = backend.mul_add(backend.encode([x % self.N]), multipliers, increments)
+        out[..., :width] = store(row)
+        for start in range(width, length, width):
+            row = backend.mul_add(row, step_a, step_c)
+            end = min(start + width, length)
+            out[..., start:end] = store(row[..., :end - start])
+
+        if out.ndim == 2:
+            return int(out[0, -1]) << 64 | int(out[1, -1])
+        return int(out[-1])
+
+    @profiled(count='length')
+    def generate_limbs(self, length, block_size=DEFAULT_BLOCK_SIZE, check_period=None):
+        """
+        Генерирует последовательность для N = 2^k, 64 < k <= 128 в виде
+        64-битных слов, не создавая целых Python
+
+        Args:
+            check_period: проверка длины по периоду (см. _check_length)
+        Returns:
+            массив np.uint64 формы (2, length): старшие и младшие слова,
+            x = (high << 64) | low
+        """
+        if not isinstance(self._backend, TwoLimbBackend):
+            raise ValueError("Представление словами доступно только для N = 2^k, 64 < k <= 128")
+        if block_size < 1:
+            raise ValueError("block_size должен быть положительным")
+        self._check_length(length, check_period, stacklevel=4)
+        out = np.empty((2, length), dtype=np.uint64)
+        if length:
+            self.current = self._fill_block(self.current, out, block_size)
+        return out
+
     def get_normalized_next(self):
         """Возвращает следующее число, нормализованное к интервалу [0,1]"""
         return self.next() / self.N
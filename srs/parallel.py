@@ -0,0 +1,123 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from srs.mcg import DEFAULT_BLOCK_SIZE, MCG, create_generators
+from srs.profiling import profiled
+
+
+def partition(length, chunks):
+    """
+    Делит диапазон индексов [0, length) на непересекающиеся смежные участки
+
+    Returns:
+        список пар (start, stop)
+    """
+    chunks = max(1, min(chunks, length))
+    bounds = [length * i // chunks for i in range(chunks + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(chunks) if bounds[i] < bounds[i + 1]]
+
+
+def _fill_chunk(task):
+    """
+    Рабочий процесс: перескакивает на начало своего участка и пишет значения
+    прямо в общую память, ничего не возвращая родителю
+    """
+    shm_name, length, N, a, c, x0, start, stop, block_size = task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buffer = np.ndarray(length, dtype=np.uint64, buffer=shm.buf)
+        generator = MCG(N=N, a=a, c=c, x0=x0)
+        generator.jump(start)
+        generator.generate_block(stop - start, block_size, out=buffer[start:stop])
+        del buffer
+    finally:
+        shm.close()
+
+
+def fill_shared(shm_name, length, generator, executor, chunks, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Записывает length следующих значений генератора в блок общей памяти
+
+    Диапазон индексов делится на непересекающиеся участки, каждый процесс
+    executor начинает со своего смещения через jump() от текущего состояния
+    генератора. Состояние самого генератора не изменяется.
+
+    Args:
+        shm_name: имя блока SharedMemory размером не меньше 8 * length байт
+        generator: экземпляр MCG (N <= 2^64)
+        executor: пул процессов (concurrent.futures.ProcessPoolExecutor)
+        chunks: число участков
+    """
+    if generator.N > 2 ** 64:
+        raise ValueError("Параллельная генерация поддерживает только N <= 2^64")
+    tasks = [(shm_name, length, generator.N, generator.a, generator.c,
+              generator.current, start, stop, block_size)
+             for start, stop in partition(length, chunks)]
+    # list() пробрасывает исключения из рабочих процессов
+    list(executor.map(_fill_chunk, tasks))
+
+
+@profiled(count='length')
+def generate_parallel(generator, length, workers=None, chunks=None,
+                      block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Генерирует последовательность заданной длины на нескольких процессах
+
+    Результат совпадает с generator.generate_block(length), состояние
+    генератора продвигается так же (см. fill_shared).
+
+    Args:
+        generator: экземпляр MCG (N <= 2^64)
+        length: длина последовательности
+        workers: число процессов (по умолчанию - число ядер)
+        chunks: число участков (по умолчанию - по одному на процесс)
+        block_size: ширина векторного блока в каждом процессе
+    Returns:
+        массив np.uint64 длины length, расположенный прямо в общей памяти
+        (без копирования); память освобождается вместе с массивом
+    """
+    if generator.N > 2 ** 64:
+        raise ValueError("Параллельная генерация поддерживает только N <= 2^64")
+    workers = workers or os.cpu_count() or 1
+    if length == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    shm = shared_memory.SharedMemory(create=True, size=length * np.dtype(np.uint64).itemsize)
+    try:
+        chunks = chunks or workers
+        with ProcessPoolExecutor(max_workers=min(workers, chunks, length)) as executor:
+            fill_shared(shm.name, length, generator, executor, chunks, block_size)
+        result = np.ndarray(length, dtype=np.uint64, buffer=shm.buf)
+    except BaseException:
+        shm.close()
+        raise
+    finally:
+        # Имя больше не нужно: отображение остается доступным до close()
+        shm.unlink()
+
+    # Блок закрывается, когда удалены массив и все его представления (их base -
+    # сам массив). При выходе из интерпретатора close() не вызывается: массив
+    # еще может быть жив, а отображение освободит операционная система
+    weakref.finalize(result, shm.close).atexit = False
+    generator.skip(length)
+    return result
+
+
+if __name__ == "__main__":
+    import time
+
+    length = 10 ** 8
+    generator = create_generators()
+
+    start_time = time.perf_counter()
+    sequence = generate_parallel(generator, length)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Сгенерировано {length} чисел за {elapsed:.2f} с "
+          f"({length / elapsed / 1e6:.1f} млн чисел/с)")
+    print(f"Последнее число: {sequence[-1]}")
+    print(f"Проверка через element_at: {create_generators().element_at(length - 1)}")
@@ -0,0 +1,210 @@
+import math
+import random
+from collections import namedtuple
+
+# Длина предпериода (число значений до входа в цикл) и длина цикла
+CycleStructure = namedtuple('CycleStructure', ['preperiod', 'period'])
+
+_SMALL_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+
+
+def is_prime(n):
+    """Тест Миллера-Рабина (детерминированный для n < 3.3 * 10^24)"""
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in _SMALL_PRIMES:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n):
+    """Нетривиальный делитель составного нечетного n (ро-метод Полларда в варианте Брента)"""
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = math.gcd(abs(x - saved), n)
+        if g != n:
+            return g
+
+
+def factorize(n):
+    """
+    Разложение натурального числа на простые множители
+
+    Returns:
+        словарь {простое: показатель}
+    """
+    factors = {}
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        else:
+            divisor = _pollard_brent(m)
+            stack.extend([divisor, m // divisor])
+    return factors
+
+
+def carmichael(factors):
+    """Функция Кармайкла lambda(n) по разложению n"""
+    result = 1
+    for p, e in factors.items():
+        if p == 2 and e >= 3:
+            value = 2 ** (e - 2)
+        else:
+            value = (p - 1) * p ** (e - 1)
+        result = result * value // math.gcd(result, value)
+    return result
+
+
+def multiplicative_order(a, n):
+    """Порядок a в мультипликативной группе по модулю n (gcd(a, n) = 1)"""
+    if n == 1:
+        return 1
+    if math.gcd(a, n) != 1:
+        raise ValueError("Порядок определен только для a, взаимно простого с n")
+    if n & (n - 1) == 0:
+        return order_mod_power_of_two(a, n.bit_length() - 1)
+
+    order = carmichael(factorize(n))
+    for q in factorize(order):
+        while order % q == 0 and pow(a, order // q, n) == 1:
+            order //= q
+    return order
+
+
+def order_mod_power_of_two(a, k):
+    """Порядок нечетного a по модулю 2^k: все порядки - степени двойки"""
+    modulus = 1 << k
+    x, order = a % modulus, 1
+    while x != 1 % modulus:
+        x = x * x % modulus
+        order *= 2
+    return order
+
+
+def hull_dobell(N, a, c):
+    """
+    Условия Халла-Добелла полного периода N для x -> (a x + c) mod N:
+    gcd(c, N) = 1; a - 1 делится на все простые делители N; 4 | (a - 1), если 4 | N
+    """
+    if math.gcd(c, N) != 1:
+        return False
+    if N % 4 == 0 and (a - 1) % 4:
+        return False
+    return all((a - 1) % p == 0 for p in factorize(N))
+
+
+def _advance(N, a, c, x, n):
+    """Значение через n шагов x -> (a x + c) mod N за O(log n) умножений"""
+    acc_a, acc_c = 1, 0
+    mul_a, mul_c = a % N, c % N
+    while n:
+        if n & 1:
+            acc_a, acc_c = acc_a * mul_a % N, (mul_a * acc_c + mul_c) % N
+        mul_a, mul_c = mul_a * mul_a % N, (mul_a * mul_c + mul_c) % N
+        n >>= 1
+    return (acc_a * x + acc_c) % N
+
+
+def _two_adic_valuation(x):
+    return (x & -x).bit_length() - 1
+
+
+def _power_of_two_multiplicative(k, a, x0):
+    """Структура цикла для N = 2^k, c = 0 через 2-адические нормы a и x0"""
+    N = 1 << k
+    x0 %= N
+    a %= N
+    if x0 == 0:
+        return CycleStructure(0, 1)
+    v = _two_adic_valuation(x0)
+    if a % 2:
+        # a^n * x0 = x0 mod 2^k  <=>  a^n = 1 mod 2^(k - v)
+        return CycleStructure(0, order_mod_power_of_two(a, k - v))
+    if a == 0:
+        return CycleStructure(1, 1)
+    # Четный множитель: значения обнуляются после ceil((k - v) / v2(a)) шагов
+    return CycleStructure(-(-(k - v) // _two_adic_valuation(a)), 1)
+
+
+def sequence_period(N, a, c, x0):
+    """
+    Длины предпериода и периода последовательности x -> (a x + c) mod N от x0
+    без перебора значений
+
+    Для N = 2^k и c = 0 используется порядок a по модулю 2^k и 2-адическая
+    норма x0, для c != 0 - условия Халла-Добелла. В общем случае модуль
+    раскладывается на множители: по простым, делящим a, последовательность
+    стабилизируется, а по остальным отображение обратимо и период равен
+    порядку этого аффинного отображения на x0.
+
+    Returns:
+        CycleStructure(preperiod, period)
+    """
+    if N == 1:
+        return CycleStructure(0, 1)
+    is_power_of_two = N & (N - 1) == 0
+    if is_power_of_two and c % N == 0:
+        return _power_of_two_multiplicative(N.bit_length() - 1, a, x0)
+    if c % N and hull_dobell(N, a, c):
+        return CycleStructure(0, N)
+
+    factors = factorize(N)
+    stable = math.prod(p ** e for p, e in factors.items() if a % p == 0)
+    invertible = N // stable
+
+    # Часть модуля с простыми, делящими a: единственная неподвижная точка
+    preperiod = 0
+    x = x0 % stable
+    while (a * x + c) % stable != x:
+        x = (a * x + c) % stable
+        preperiod += 1
+
+    # Обратимая часть: период делит invertible * lambda(invertible)
+    period = 1
+    if invertible > 1:
+        start = x0 % invertible
+        period = invertible * carmichael(factorize(invertible))
+        for q in factorize(period):
+            while period % q == 0 and _advance(invertible, a, c, start, period // q) == start:
+                period //= q
+
+    return CycleStructure(preperiod, period)
@@ -0,0 +1,92 @@
+import numpy as np
+from scipy import stats
+
+from srs.profiling import profiled
+
+
+class PlaneAccumulator:
+    """
+    Потоковое распределение пар (εᵢ, εᵢ₊₁) или троек (εᵢ, εᵢ₊₁, εᵢ₊₂)
+
+    Точки накапливаются в сетку счетчиков фиксированного разрешения
+    (bins по каждой оси), последние значения блока переносятся в следующий,
+    так что учитываются все соседние пары/тройки. Память и стоимость
+    отрисовки не зависят от объема выборки. Попутно накапливаются суммы
+    для коэффициента корреляции соседних значений.
+    """
+
+    def __init__(self, N, bins=64, dimension=2):
+        """
+        Args:
+            N: модуль генератора
+            bins: число интервалов сетки по каждой оси
+            dimension: 2 - пары, 3 - тройки соседних значений
+        """
+        if dimension not in (2, 3):
+            raise ValueError("Поддерживаются только размерности 2 и 3")
+        self.N = N
+        self.bins = bins
+        self.dimension = dimension
+        self.counts = np.zeros((bins,) * dimension, dtype=np.int64)
+        self.points = 0
+        self._sums = np.zeros(5)  # x, y, x^2, y^2, xy для соседних пар
+        self._pair_count = 0
+        self._tail = np.zeros(0)
+
+    @profiled(count='values')
+    def update(self, values):
+        """Добавляет очередной блок значений генератора"""
+        carried = len(self._tail)
+        normalized = np.concatenate([self._tail, np.asarray(values, dtype=np.float64) / self.N])
+        self._tail = normalized[max(len(normalized) - (self.dimension - 1), 0):]
+
+        # Пары внутри перенесенного хвоста уже учтены в корреляции
+        first = max(carried - 1, 0)
+        x, y = normalized[first:-1], normalized[first + 1:]
+        self._sums += [x.sum(), y.sum(), x @ x, y @ y, x @ y]
+        self._pair_count += len(x)
+        if len(normalized) < self.dimension:
+            return self
+
+        cells = np.minimum((normalized * self.bins).astype(np.intp), self.bins - 1)
+        points = len(normalized) - self.dimension + 1
+        flat = np.zeros(points, dtype=np.intp)
+        for axis in range(self.dimension):
+            flat = flat * self.bins + cells[axis:axis + points]
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+        self.points += points
+        return self
+
+    def correlation(self):
+        """Коэффициент корреляции между εᵢ и εᵢ₊₁"""
+        sx, sy, sxx, syy, sxy = self._sums
+        n = self._pair_count
+        covariance = sxy / n - sx * sy / n ** 2
+        return float(covariance / np.sqrt((sxx / n - (sx / n) ** 2) * (syy / n - (sy / n) ** 2)))
+
+    def chi_square(self):
+        """
+        Критерий хи-квадрат равномерности по ячейкам сетки
+
+        Соседние точки перекрываются и не независимы, поэтому p-значение -
+        ориентировочное; для хорошего генератора статистика близка к числу ячеек.
+
+        Returns:
+            (статистика, p-значение)
+        """
+        expected = self.points / self.counts.size
+        statistic = float(np.sum((self.counts - expected) ** 2) / expected)
+        return statistic, float(stats.chi2.sf(statistic, self.counts.size - 1))
+
+    @profiled()
+    def result(self):
+        chi_square, p_value = self.chi_square()
+        return {
+            'points': self.points,
+            'dimension': self.dimension,
+            'bins': self.bins,
+            'correlation': self.correlation(),
+            'chi_square': chi_square,
+            'chi_square_p_value': p_value,
+            'empty_cells': int(np.count_nonzero(self.counts == 0)),
+        }
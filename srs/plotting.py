@@ -0,0 +1,269 @@
+import os
+import sys
+
+import numpy as np
+
+from srs.profiling import stage
+
+# Непустое значение (кроме '0') отключает построение графиков по умолчанию
+NO_PLOT_ENV = 'MCG_NO_PLOT'
+
+# Функции отрисовки по виду графика: plotter(data, filename)
+PLOTTERS = {}
+
+
+def plots_enabled(plot=None):
+    """
+    Нужно ли строить графики
+
+    Args:
+        plot: явный выбор; None - по переменной окружения MCG_NO_PLOT
+    """
+    if plot is not None:
+        return plot
+    return os.environ.get(NO_PLOT_ENV, '') in ('', '0')
+
+
+def get_pyplot():
+    """
+    Импорт matplotlib.pyplot при первом обращении
+
+    Импорт matplotlib занимает заметную долю времени короткого прогона,
+    поэтому модули тестов не импортируют его, пока график не нужен.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def register(kind):
+    """Декоратор: регистрирует функцию отрисовки графика вида kind"""
+    def decorator(func):
+        PLOTTERS[kind] = func
+        return func
+    return decorator
+
+
+def output(kind, name, plot=None, save=False, **arrays):
+    """
+    Вывод результатов теста в виде графика
+
+    Args:
+        kind: вид графика из PLOTTERS
+        name: имя файлов без расширения (name.png, name.npz)
+        plot: построить name.png сразу (None - по MCG_NO_PLOT)
+        save: сохранить массивы в name.npz для отложенной отрисовки
+        arrays: данные для графика
+    """
+    if save:
+        np.savez(f'{name}.npz', kind=kind, **arrays)
+    if plots_enabled(plot):
+        with stage(f'plotting.{kind}'):
+            PLOTTERS[kind](arrays, f'{name}.png')
+
+
+def render(path):
+    """
+    Отложенная отрисовка: строит график по массивам, сохраненным output(save=True)
+
+    Returns:
+        имя файла изображения
+    """
+    with np.load(path) as data:
+        arrays = {key: data[key].item() if data[key].ndim == 0 else data[key]
+                  for key in data.files}
+    filename = os.path.splitext(path)[0] + '.png'
+    PLOTTERS[arrays.pop('kind')](arrays, filename)
+    return filename
+
+
+@register('histogram')
+def plot_histogram(data, filename):
+    plt = get_pyplot()
+    density = data['density']
+    plt.figure(figsize=(12, 6))
+
+    # Построение гистограммы по накопленным счетчикам
+    bins = np.linspace(0, 1, len(density) + 1)
+    plt.bar(bins[:-1], density, width=np.diff(bins), align='edge',
+            alpha=0.7, color='blue', edgecolor='black')
+
+    # Добавляем линию равномерного распределения для сравнения
+    plt.axhline(y=1, color='r', linestyle='--', label='Идеальное равномерное распределение')
+
+    plt.title(f'Гистограмма распределения {data["sample_size"]} элементов последовательности\n'
+              f'Среднее = {data["mean"]:.4f}, СКО = {data["std"]:.4f}')
+    plt.xlabel('Значение')
+    plt.ylabel('Плотность')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.savefig(filename)
+    plt.close()
+
+
+@register('autocorrelation')
+def plot_autocorrelation(data, filename):
+    plt = get_pyplot()
+    acf = data['acf']
+    confidence_interval = data['confidence_interval']
+    plt.figure(figsize=(12, 6))
+    lags = np.arange(len(acf))
+
+    # Основной график ACF
+    plt.stem(lags, acf, basefmt='b-', linefmt='b-', markerfmt='bo', label='ACF')
+
+    # Добавляем доверительные интервалы
+    plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+    plt.axhline(y=confidence_interval, color='r', linestyle='--', alpha=0.5,
+                label='95% доверительный интервал')
+    plt.axhline(y=-confidence_interval, color='r', linestyle='--', alpha=0.5)
+
+    plt.title('Автокорреляционная функция')
+    plt.xlabel('Сдвиг (lag)')
+    plt.ylabel('ACF')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+@register('linear_complexity')
+def plot_linear_complexity(data, filename):
+    plt = get_pyplot()
+    profile = data['profile']
+    plt.figure(figsize=(12, 6))
+
+    # График профиля линейной сложности
+    x = np.arange(1, len(profile) + 1)
+    plt.plot(x, profile, 'b-', label='Профиль линейной сложности')
+
+    # Идеальная линия N/2
+    plt.plot(x, x / 2, 'r--', label='Идеальная линия (N/2)')
+
+    plt.title('Профиль линейной сложности')
+    plt.xlabel('Длина подпоследовательности (N)')
+    plt.ylabel('Линейная сложность (L)')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+@register('monotonicity')
+def plot_monotonicity(data, filename):
+    plt = get_pyplot()
+    plt.figure(figsize=(15, 6))
+
+    for position, (key, title) in enumerate([
+            ('increasing', 'Распределение длин участков возрастания'),
+            ('decreasing', 'Распределение длин участков убывания')], start=1):
+        histogram = data[key]
+        plt.subplot(1, 2, position)
+        plt.bar(np.arange(len(histogram)), histogram / histogram.sum(), alpha=0.7)
+        plt.title(title)
+        plt.xlabel('Длина участка')
+        plt.ylabel('Частота')
+        plt.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+@register('series')
+def plot_series(data, filename):
+    plt = get_pyplot()
+    bit_counts = np.asarray(data['bit_counts'])
+    series_counts = np.asarray(data['series_counts'])
+    k = int(np.log2(len(series_counts)))
+
+    plt.figure(figsize=(12, 5))
+
+    # График для отдельных битов
+    plt.subplot(1, 2, 1)
+    plt.bar(['0', '1'], bit_counts / bit_counts.sum(), color=['blue', 'green'])
+    plt.title('Частота появления битов')
+    plt.ylabel('Относительная частота')
+    plt.axhline(y=0.5, color='r', linestyle='--', label='Идеальная частота (0.5)')
+    plt.legend()
+
+    # График для серий
+    plt.subplot(1, 2, 2)
+    series_labels = [format(code, f'0{k}b') for code in range(len(series_counts))]
+    plt.bar(series_labels, series_counts / series_counts.sum())
+    plt.title(f'Частота появления серий длины {k}')
+    plt.xticks(rotation=45)
+    plt.ylabel('Относительная частота')
+    plt.axhline(y=1 / 2 ** k, color='r', linestyle='--',
+                label=f'Идеальная частота (1/{2 ** k})')
+    plt.legend()
+
+    plt.tight_layout()
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+@register('plane')
+def plot_plane(data, filename):
+    plt = get_pyplot()
+    field_size = data['field_size']
+    plt.figure(figsize=(12, 12))
+
+    # Основной график разброса точек
+    plt.scatter(data['x'], data['y'], alpha=0.5, s=1)
+    plt.grid(True, alpha=0.3)
+
+    plt.title(f'Распределение на плоскости\nДлина последовательности: {data["sequence_length"]}, '
+              f'Размер поля: {field_size}x{field_size}')
+    plt.xlabel('εᵢ')
+    plt.ylabel('εᵢ₊₁')
+
+    # Одинаковый масштаб по осям, пределы от 0 до field_size
+    plt.axis('equal')
+    plt.xlim(0, field_size)
+    plt.ylim(0, field_size)
+
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+@register('heatmap')
+def plot_heatmap(data, filename):
+    plt = get_pyplot()
+    counts = data['counts']
+    bins = counts.shape[0]
+    sequence_length = data['sequence_length']
+
+    if counts.ndim == 2:
+        plt.figure(figsize=(10, 9))
+        plt.imshow(counts.T, origin='lower', extent=(0, 1, 0, 1),
+                   cmap='viridis', interpolation='nearest')
+        plt.colorbar(label='Количество точек')
+        plt.xlabel('εᵢ / N')
+        plt.ylabel('εᵢ₊₁ / N')
+        plt.title(f'Распределение на плоскости (сетка {bins}x{bins})\n'
+                  f'Длина последовательности: {sequence_length}')
+    else:
+        # Срезы куба по εᵢ₊₂: на них видны плоскости, содержащие тройки
+        slices = np.linspace(0, bins - 1, 4).astype(int)
+        fig, axes = plt.subplots(1, len(slices), figsize=(5 * len(slices), 5))
+        for ax, index in zip(axes, slices):
+            ax.imshow(counts[:, :, index].T, origin='lower', extent=(0, 1, 0, 1),
+                      cmap='viridis', interpolation='nearest')
+            ax.set_title(f'εᵢ₊₂ / N ≈ {(index + 0.5) / bins:.2f}')
+            ax.set_xlabel('εᵢ / N')
+            ax.set_ylabel('εᵢ₊₁ / N')
+        fig.suptitle(f'Распределение троек (сетка {bins}^3), длина последовательности: {sequence_length}')
+
+    plt.savefig(filename, dpi=100, bbox_inches='tight')
+    plt.close()
+
+
+if __name__ == "__main__":
+    # Отложенная отрисовка: python -m srs.plotting результат.npz ...
+    for path in sys.argv[1:]:
+        print(f"{path} -> {render(path)}")
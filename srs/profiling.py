@@ -0,0 +1,283 @@
+import cProfile
+import functools
+import inspect
+import json
+import operator
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+# MCG_PROFILE=1 включает замеры при импорте, MCG_PROFILE=memory - вместе с памятью
+PROFILE_ENV = 'MCG_PROFILE'
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Накопленные замеры одного этапа"""
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    values: int = 0  # число обработанных значений (если известно)
+    peak_memory: int = 0  # наибольший прирост выделенной памяти за вызов, байт
+
+    @property
+    def throughput(self):
+        """Значений в секунду"""
+        return self.values / self.seconds if self.seconds else 0.0
+
+
+class _Frame:
+    __slots__ = ('start_memory', 'peak')
+
+    def __init__(self, start_memory):
+        self.start_memory = start_memory
+        self.peak = start_memory
+
+
+class _State:
+    enabled = False
+    memory = False
+    stats = {}
+    frames = []
+
+
+class _NullStage:
+    """Этап при выключенных замерах: ничего не делает"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add_values(self, count):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('name', 'values', 'start', 'frame')
+
+    def __init__(self, name, values):
+        self.name = name
+        self.values = values
+
+    def __enter__(self):
+        if _State.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if _State.frames:
+                parent = _State.frames[-1]
+                parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+            self.frame = _Frame(current)
+            _State.frames.append(self.frame)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stats = _State.stats.get(self.name)
+        if stats is None:
+            stats = _State.stats[self.name] = StageStats(self.name)
+        stats.calls += 1
+        stats.seconds += elapsed
+        stats.values += self.values
+
+        if _State.memory and _State.frames and _State.frames[-1] is self.frame:
+            _State.frames.pop()
+            self.frame.peak = max(self.frame.peak, tracemalloc.get_traced_memory()[1])
+            stats.peak_memory = max(stats.peak_memory, self.frame.peak - self.frame.start_memory)
+            if _State.frames:
+                parent = _State.frames[-1]
+                parent.peak = max(parent.peak, self.frame.peak)
+        return False
+
+    def add_values(self, count):
+        """Добавляет число обработанных значений, если оно известно только внутри этапа"""
+        self.values += count
+
+
+def enable(memory=False):
+    """
+    Включает замеры
+
+    Args:
+        memory: отслеживать пиковую память этапов через tracemalloc
+            (заметно замедляет выделение памяти)
+    """
+    _State.enabled = True
+    _State.memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    _State.enabled = False
+    if _State.memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _State.memory = False
+    _State.frames.clear()
+
+
+def is_enabled():
+    return _State.enabled
+
+
+def reset():
+    """Удаляет накопленные замеры"""
+    _State.stats.clear()
+
+
+def stage(name, values=0):
+    """
+    Контекстный менеджер замера этапа
+
+        with stage('acf', values=len(chunk)):
+            ...
+
+    При выключенных замерах возвращает общий пустой объект, так что
+    стоимость - один вызов функции.
+    """
+    if not _State.enabled:
+        return _NULL_STAGE
+    return _Stage(name, values)
+
+
+def profiled(name=None, count=None):
+    """
+    Декоратор замера функции
+
+    Args:
+        name: имя этапа (по умолчанию - модуль.имя функции)
+        count: имя аргумента с числом обработанных значений: если он целый
+            (в том числе целое NumPy), берется его значение, иначе - его длина
+    """
+    def decorator(func):
+        stage_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+        signature = inspect.signature(func) if count else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return func(*args, **kwargs)
+            values = 0
+            if count:
+                argument = signature.bind(*args, **kwargs).arguments.get(count)
+                if argument is not None:
+                    try:
+                        values = operator.index(argument)
+                    except TypeError:
+                        values = len(argument)
+            with _Stage(stage_name, values):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def stats():
+    """Копия накопленных замеров: {имя этапа: StageStats}"""
+    return {name: StageStats(**asdict(stats)) for name, stats in _State.stats.items()}
+
+
+def summary(sort='seconds'):
+    """
+    Таблица замеров по этапам
+
+    Args:
+        sort: поле StageStats для сортировки по убыванию
+    """
+    rows = sorted(_State.stats.values(), key=lambda stats: getattr(stats, sort), reverse=True)
+    # Этапы вложены, поэтому доля считается от самого долгого (внешнего) этапа
+    total = max((stats.seconds for stats in rows), default=0.0) or 1.0
+    lines = [f"{'Этап':<44} {'вызовов':>8} {'время, с':>10} {'доля':>7} "
+             f"{'значений':>12} {'млн знач./с':>12} {'пик, МиБ':>9}"]
+    for stats in rows:
+        throughput = f"{stats.throughput / 1e6:12.2f}" if stats.values else f"{'-':>12}"
+        lines.append(f"{stats.name:<44} {stats.calls:>8} {stats.seconds:>10.4f} "
+                     f"{stats.seconds / total:>7.1%} {stats.values:>12} {throughput} "
+                     f"{stats.peak_memory / 2 ** 20:>9.1f}")
+    return "\n".join(lines)
+
+
+def save_json(path):
+    """Сохраняет замеры в JSON для сравнения запусков"""
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'memory': _State.memory,
+        'stages': [{**asdict(stats), 'throughput': stats.throughput}
+                   for stats in _State.stats.values()],
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+
+
+def load_json(path):
+    """Замеры из файла save_json(): {имя этапа: StageStats}"""
+    with open(path, encoding='utf-8') as file:
+        stages = json.load(file)['stages']
+    return {stage['name']: StageStats(**{key: value for key, value in stage.items()
+                                         if key != 'throughput'})
+            for stage in stages}
+
+
+@contextmanager
+def profile_run(path=None):
+    """
+    Запуск блока под cProfile
+
+        with profile_run('run.pstats') as profiler:
+            ...
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+
+    Args:
+        path: файл для сохранения статистики в формате pstats
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+
+
+if os.environ.get(PROFILE_ENV, '') not in ('', '0'):
+    enable(memory=os.environ[PROFILE_ENV] == 'memory')
+
+
+if __name__ == "__main__":
+    # python -m srs.profiling скрипт.py [--memory] [--json файл] [--pstats файл]
+    import argparse
+    import runpy
+    import sys
+
+    # Декораторы в модулях srs ссылаются на srs.profiling, а не на __main__
+    from srs.profiling import disable, enable, profile_run, save_json, stage, summary
+
+    parser = argparse.ArgumentParser(description="Запуск скрипта анализа с замером этапов")
+    parser.add_argument('script', help="путь к скрипту (например, tests/test_histogram.py)")
+    parser.add_argument('--memory', action='store_true', help="замерять пиковую память этапов")
+    parser.add_argument('--json', help="файл JSON для сохранения замеров")
+    parser.add_argument('--pstats', help="файл статистики cProfile")
+    parser.add_argument('--top', type=int, default=0, help="вывести N самых затратных функций cProfile")
+    args = parser.parse_args()
+
+    sys.argv = [args.script]
+    enable(memory=args.memory)
+    with profile_run(args.pstats) as profiler:
+        with stage('script:' + os.path.basename(args.script)):
+            runpy.run_path(args.script, run_name='__main__')
+    disable()
+
+    print("\n" + summary())
+    if args.json:
+        save_json(args.json)
+    if args.top:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(args.top)
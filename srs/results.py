@@ -0,0 +1,226 @@
+import json
+import math
+import time
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+# Столбцы плоской таблицы: одна строка на статистику теста
+TABLE_COLUMNS = ('test', 'statistic', 'value', 'p_value', 'degrees_of_freedom', 'sample_size',
+                 'N', 'a', 'c', 'x0', 'offset', 'elapsed', 'created', 'parameters')
+
+
+@dataclass(slots=True)
+class GeneratorParams:
+    """Параметры генератора и номер первого элемента проверенного участка"""
+    N: int
+    a: int
+    c: int
+    x0: int
+    offset: int = 0
+
+    @classmethod
+    def from_generator(cls, generator, offset=0):
+        return cls(generator.N, generator.a, generator.c, generator.initial_x0, offset)
+
+
+@dataclass(slots=True)
+class Statistic:
+    """Значение статистики критерия и его p-значение (None, если не определено)"""
+    name: str
+    value: float
+    p_value: float = None
+    degrees_of_freedom: int = None
+
+
+@dataclass(slots=True)
+class TestResult:
+    """Результат одного теста на одной выборке"""
+    test: str
+    sample_size: int
+    generator: GeneratorParams
+    statistics: list
+    parameters: dict = field(default_factory=dict)
+    elapsed: float = 0.0  # время теста, с
+    created: float = field(default_factory=time.time)  # время запуска (Unix)
+
+    def statistic(self, name):
+        for statistic in self.statistics:
+            if statistic.name == name:
+                return statistic
+        raise KeyError(name)
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data['generator'] = GeneratorParams(**data['generator'])
+        data['statistics'] = [Statistic(**statistic) for statistic in data['statistics']]
+        return cls(**data)
+
+    def rows(self):
+        """Строки плоской таблицы (по одной на статистику)"""
+        parameters = json.dumps(self.parameters, sort_keys=True, default=_json_default)
+        for statistic in self.statistics:
+            yield {
+                'test': self.test,
+                'statistic': statistic.name,
+                'value': statistic.value,
+                'p_value': math.nan if statistic.p_value is None else statistic.p_value,
+                'degrees_of_freedom': -1 if statistic.degrees_of_freedom is None
+                else statistic.degrees_of_freedom,
+                'sample_size': self.sample_size,
+                'N': self.generator.N,
+                'a': self.generator.a,
+                'c': self.generator.c,
+                'x0': self.generator.x0,
+                'offset': self.generator.offset,
+                'elapsed': self.elapsed,
+                'created': self.created,
+                'parameters': parameters,
+            }
+
+
+def _histogram(accumulator, result):
+    bins = len(accumulator.counts)
+    return [
+        Statistic('chi_square', result['chi_square'], result['chi_square_p_value'], bins - 1),
+        Statistic('ks', result['ks_statistic'], result['ks_p_value']),
+    ], {'num_bins': bins, 'fine_bins': len(accumulator.fine_counts)}
+
+
+def _acf(accumulator, result):
+    return [
+        Statistic('max_abs_acf', result['max_abs_acf']),
+        Statistic('significant_lags', len(result['significant_lags'])),
+    ], {'max_lag': accumulator.max_lag}
+
+
+def _series(accumulator, result):
+    return [
+        Statistic('chi_square_bits', result['chi_square_bits'], result['chi_square_bits_p_value'], 1),
+        Statistic('chi_square_series', result['chi_square_series'],
+                  result['chi_square_series_p_value'], 2 ** accumulator.k - 1),
+    ], {'k': accumulator.k, 'width': accumulator.width, 'shift': accumulator.shift}
+
+
+def _runs(accumulator, result):
+    return [
+        Statistic('up_down_z', result['up_down_z'], result['up_down_p_value']),
+        Statistic('knuth_v', result['knuth_v'], result['knuth_p_value'], 6),
+    ], {}
+
+
+def _plane(accumulator, result):
+    return [
+        Statistic('chi_square', result['chi_square'], result['chi_square_p_value'],
+                  accumulator.counts.size - 1),
+        Statistic('correlation', result['correlation']),
+    ], {'bins': accumulator.bins, 'dimension': accumulator.dimension}
+
+
+def _linear_complexity(accumulator, result):
+    return [
+        Statistic('linear_complexity', result['linear_complexity']),
+        Statistic('mean_deviation', result['mean_deviation']),
+    ], {'max_bits': accumulator.max_bits, 'width': accumulator.width}
+
+
+# Извлечение статистик и параметров из накопителей srs.battery.TESTS
+EXTRACTORS = {
+    'histogram': _histogram,
+    'acf': _acf,
+    'series': _series,
+    'runs': _runs,
+    'plane': _plane,
+    'linear_complexity': _linear_complexity,
+}
+
+
+def from_accumulator(test, accumulator, result, sample_size, generator, elapsed=0.0):
+    """
+    Результат теста по его накопителю и словарю accumulator.result()
+
+    Args:
+        test: имя теста из EXTRACTORS
+        generator: GeneratorParams проверенного участка последовательности
+    """
+    statistics, parameters = EXTRACTORS[test](accumulator, result)
+    statistics = [Statistic(s.name, _scalar(s.value), _scalar(s.p_value), s.degrees_of_freedom)
+                  for s in statistics]
+    return TestResult(test, sample_size, generator, statistics, parameters, elapsed)
+
+
+def write_jsonl(results, path, append=True):
+    """Записывает результаты в файл JSON Lines (по одному объекту в строке)"""
+    with open(path, 'a' if append else 'w', encoding='utf-8') as file:
+        for result in results:
+            file.write(json.dumps(result.to_dict(), ensure_ascii=False, default=_json_default))
+            file.write('\n')
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as file:
+        return [TestResult.from_dict(json.loads(line)) for line in file if line.strip()]
+
+
+def to_table(results):
+    """
+    Плоская таблица результатов: словарь {столбец: массив numpy}
+
+    Параметры генератора хранятся в uint64, если помещаются, иначе строками.
+    Отсутствующее p-значение - NaN, число степеней свободы - -1.
+    """
+    rows = [row for result in results for row in result.rows()]
+    table = {}
+    for column in TABLE_COLUMNS:
+        values = [row[column] for row in rows]
+        if column in ('N', 'a', 'c', 'x0', 'offset'):
+            table[column] = _int_column(values)
+        elif column in ('test', 'statistic', 'parameters'):
+            table[column] = np.array(values, dtype=str)
+        elif column in ('sample_size', 'degrees_of_freedom'):
+            table[column] = np.array(values, dtype=np.int64)
+        else:
+            table[column] = np.array(values, dtype=np.float64)
+    return table
+
+
+def write_npz(results, path):
+    np.savez_compressed(path, **to_table(results))
+
+
+def read_npz(path):
+    with np.load(path) as data:
+        return {column: data[column] for column in data.files}
+
+
+def write_parquet(results, path):
+    """Запись таблицы результатов в Parquet (требуется pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Для записи в Parquet установите pyarrow") from error
+    pq.write_table(pa.table(to_table(results)), path)
+
+
+def _int_column(values):
+    if all(0 <= value < 2 ** 64 for value in values):
+        return np.array(values, dtype=np.uint64)
+    return np.array([str(value) for value in values], dtype=str)
+
+
+def _scalar(value):
+    """Числа numpy -> встроенные типы Python"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Объект типа {type(value).__name__} не сериализуется в JSON")
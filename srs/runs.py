@@ -0,0 +1,188 @@
+import numpy as np
+from scipy import stats
+
+from srs.profiling import profiled
+
+# Матрица и вероятности теста "серий вверх" (Кнут, т. 2, п. 3.3.2, G)
+# для длин 1, 2, 3, 4, 5 и >= 6
+KNUTH_RUNS_A = np.array([
+    [4529.4, 9044.9, 13568, 18091, 22615, 27892],
+    [9044.9, 18097, 27139, 36187, 45234, 55789],
+    [13568, 27139, 40721, 54281, 67852, 83685],
+    [18091, 36187, 54281, 72414, 90470, 111580],
+    [22615, 45234, 67852, 90470, 113262, 139476],
+    [27892, 55789, 83685, 111580, 139476, 172860],
+])
+KNUTH_RUNS_B = np.array([1 / 6, 5 / 24, 11 / 120, 19 / 720, 29 / 5040, 1 / 840])
+
+
+class RunsAccumulator:
+    """
+    Потоковый анализ участков монотонности
+
+    Участки возрастания и убывания (соседние участки делят общую точку)
+    выделяются по знаку np.diff и сразу накапливаются в гистограммы длин.
+    Незавершенный участок переносится через границу блоков, поэтому
+    результат не зависит от разбиения последовательности на блоки.
+    Параллельно считаются длины "серий вверх" для критерия Кнута.
+
+    Длина участка - число элементов в нем. Равные соседние значения
+    считаются шагом вниз.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.increasing = np.zeros(0, dtype=np.int64)  # increasing[l] - число участков длины l
+        self.decreasing = np.zeros(0, dtype=np.int64)
+        self.knuth_counts = np.zeros(6, dtype=np.int64)
+        self._last = None
+        self._direction = None  # направление незавершенного участка
+        self._steps = 0  # число шагов в незавершенном участке
+        self._run_up = 0  # длина незавершенной серии вверх
+
+    @profiled(count='chunk')
+    def update(self, chunk):
+        """Добавляет очередной блок последовательности"""
+        chunk = np.asarray(chunk)
+        if not len(chunk):
+            return self
+        self.count += len(chunk)
+
+        if self._last is None:
+            values = chunk
+            self._run_up = 1
+        else:
+            values = np.concatenate([[self._last], chunk])
+        self._last = chunk[-1]
+        if len(values) < 2:
+            return self
+
+        up = values[1:] > values[:-1]
+        self._update_monotonic(up)
+        self._update_runs_up(up)
+        return self
+
+    def _update_monotonic(self, up):
+        """Участки монотонности по направлениям шагов"""
+        starts = np.concatenate([[0], np.flatnonzero(up[1:] != up[:-1]) + 1])
+        steps = np.diff(np.concatenate([starts, [len(up)]]))
+        directions = up[starts]
+
+        if self._direction is not None:
+            if directions[0] == self._direction:
+                steps[0] += self._steps
+            else:
+                self._add_run(self._direction, self._steps)
+
+        # Последний участок может продолжиться в следующем блоке
+        self._direction, self._steps = bool(directions[-1]), int(steps[-1])
+        steps, directions = steps[:-1], directions[:-1]
+        self.increasing = _add_lengths(self.increasing, steps[directions] + 1)
+        self.decreasing = _add_lengths(self.decreasing, steps[~directions] + 1)
+
+    def _update_runs_up(self, up):
+        """Серии вверх: каждый шаг не вверх начинает новую серию"""
+        breaks = np.flatnonzero(~up)
+        if not len(breaks):
+            self._run_up += len(up)
+            return
+        lengths = np.diff(breaks)
+        first = self._run_up + breaks[0]
+        self._add_knuth(np.concatenate([[first], lengths]))
+        self._run_up = len(up) - breaks[-1]
+
+    def _add_run(self, direction, steps):
+        if direction:
+            self.increasing = _add_lengths(self.increasing, [steps + 1])
+        else:
+            self.decreasing = _add_lengths(self.decreasing, [steps + 1])
+
+    def _add_knuth(self, lengths):
+        self.knuth_counts += np.bincount(np.minimum(lengths, 6) - 1, minlength=6)
+
+    def histograms(self):
+        """
+        Гистограммы длин участков возрастания и убывания с учетом
+        незавершенного последнего участка
+
+        Returns:
+            (increasing, decreasing): массивы, где [l] - число участков длины l
+        """
+        increasing, decreasing = self.increasing, self.decreasing
+        if self._direction is not None:
+            if self._direction:
+                increasing = _add_lengths(increasing, [self._steps + 1])
+            else:
+                decreasing = _add_lengths(decreasing, [self._steps + 1])
+        return increasing, decreasing
+
+    def up_down_test(self):
+        """
+        Критерий серий вверх и вниз (Вальд-Вольфовиц/Левен):
+        число участков монотонности R при n элементах асимптотически нормально
+        со средним (2n - 1) / 3 и дисперсией (16n - 29) / 90
+
+        Returns:
+            (число участков, z-статистика, двустороннее p-значение)
+        """
+        increasing, decreasing = self.histograms()
+        runs = int(increasing.sum() + decreasing.sum())
+        n = self.count
+        z = (runs - (2 * n - 1) / 3) / np.sqrt((16 * n - 29) / 90)
+        return runs, float(z), float(2 * stats.norm.sf(abs(z)))
+
+    def knuth_runs_up_test(self):
+        """
+        Критерий "серий вверх" Кнута: статистика V с 6 степенями свободы
+
+        Returns:
+            (V, p-значение)
+        """
+        counts = self.knuth_counts.copy()
+        if self._run_up:
+            counts[min(self._run_up, 6) - 1] += 1
+        n = self.count
+        deviation = counts - n * KNUTH_RUNS_B
+        v = float(deviation @ KNUTH_RUNS_A @ deviation / (n - 6))
+        return v, float(stats.chi2.sf(v, 6))
+
+    @profiled()
+    def result(self):
+        increasing, decreasing = self.histograms()
+        runs, z, up_down_p = self.up_down_test()
+        v, knuth_p = self.knuth_runs_up_test()
+        return {
+            'sample_size': self.count,
+            'increasing': increasing,
+            'decreasing': decreasing,
+            'runs': runs,
+            'up_down_z': z,
+            'up_down_p_value': up_down_p,
+            'knuth_v': v,
+            'knuth_p_value': knuth_p,
+        }
+
+
+def _add_lengths(histogram, lengths):
+    """Добавляет длины в гистограмму, расширяя ее при необходимости"""
+    counts = np.bincount(np.asarray(lengths, dtype=np.intp))
+    if len(counts) > len(histogram):
+        histogram = np.concatenate([histogram, np.zeros(len(counts) - len(histogram), dtype=np.int64)])
+    else:
+        histogram = histogram.copy()
+    histogram[:len(counts)] += counts
+    return histogram
+
+
+def run_length_histograms(numbers, chunk_size=1 << 20):
+    """
+    Гистограммы длин участков возрастания и убывания за один проход
+
+    Returns:
+        (increasing, decreasing, accumulator)
+    """
+    accumulator = RunsAccumulator()
+    for start in range(0, len(numbers), chunk_size):
+        accumulator.update(numbers[start:start + chunk_size])
+    increasing, decreasing = accumulator.histograms()
+    return increasing, decreasing, accumulator
@@ -0,0 +1,182 @@
+import os
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from srs.battery import DEFAULT_CHUNK_SIZE, TESTS
+from srs.mcg import MCG, create_generators
+from srs.parallel import fill_shared
+from srs.results import GeneratorParams, from_accumulator
+
+DEFAULT_MEMORY_BUDGET = 1 << 30  # 1 ГиБ
+
+# Байт на значение блока: сам блок uint64 и временные массивы float64/intp в update()
+_BYTES_PER_VALUE = 64
+
+# Оценка памяти состояния накопителей, байт
+_STATE_BYTES = {
+    'histogram': 8 * (1 << 16),
+    'plane': 8 * 64 * 64,
+    'linear_complexity': 16 * 10000,
+}
+
+
+@dataclass
+class TaskRecord:
+    """Результат одной задачи (тест, размер выборки)"""
+    test: str
+    sample_size: int
+    offset: int
+    elapsed: float
+    peak_memory: int
+    result: dict = field(repr=False)
+    test_result: object = field(default=None, repr=False)  # srs.results.TestResult
+
+
+def estimate_memory(test, sample_size, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Оценка пиковой памяти задачи в байтах"""
+    return _BYTES_PER_VALUE * min(chunk_size, sample_size) + _STATE_BYTES.get(test, 0)
+
+
+def _accumulate(test, generator, values, chunk_size):
+    accumulator = TESTS[test](generator)
+    for start in range(0, len(values), chunk_size):
+        accumulator.update(values[start:start + chunk_size])
+    return accumulator, accumulator.result()
+
+
+def _run_task(test, sample_size, shm_name, length, N, a, c, x0, offset, chunk_size, memory):
+    """
+    Рабочий процесс: прогоняет первые sample_size значений из общей памяти
+    через накопитель теста, ничего не генерируя сам
+
+    Время замеряется без трассировки памяти; пиковая память (если memory) -
+    отдельным повторным прогоном под tracemalloc, как в srs.benchmark.measure
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        values = np.ndarray(length, dtype=np.uint64, buffer=shm.buf)[:sample_size]
+        generator = MCG(N=N, a=a, c=c, x0=x0)
+        chunk_size = max(min(chunk_size, sample_size), 1)
+
+        start = time.perf_counter()
+        accumulator, result = _accumulate(test, generator, values, chunk_size)
+        elapsed = time.perf_counter() - start
+
+        peak = 0
+        if memory:
+            tracemalloc.start()
+            try:
+                _accumulate(test, generator, values, chunk_size)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        del values
+    finally:
+        shm.close()
+
+    test_result = from_accumulator(test, accumulator, result, sample_size,
+                                   GeneratorParams(N, a, c, x0, offset), elapsed)
+    return TaskRecord(test, sample_size, offset, elapsed, peak, result, test_result)
+
+
+def run_matrix(tests, sample_sizes, generator=None, offset=0, workers=None,
+               memory_budget=DEFAULT_MEMORY_BUDGET, chunk_size=DEFAULT_CHUNK_SIZE,
+               memory=True, verbose=True):
+    """
+    Выполняет все сочетания (тест, размер выборки) на пуле процессов
+
+    Последовательность от элемента offset генерируется один раз (параллельно,
+    см. srs.parallel.fill_shared) в блок общей памяти длины наибольшей выборки,
+    и каждая задача читает из него свой срез, так что все задачи видят ту же
+    последовательность, что и однопоточный запуск. Новые задачи запускаются,
+    только пока общий блок вместе с суммарной оценкой памяти выполняющихся
+    задач не превышает memory_budget.
+
+    Args:
+        tests: имена тестов из srs.battery.TESTS
+        sample_sizes: размеры выборок (общие для всех тестов) или словарь
+            {тест: список размеров}
+        generator: экземпляр MCG (по умолчанию - генератор из задания);
+            используются его параметры и начальное значение x0
+        offset: номер первого элемента последовательности
+        workers: число процессов (по умолчанию - число ядер)
+        memory_budget: ограничение памяти общего блока и задач, байт
+        chunk_size: размер блока, передаваемого накопителю
+        memory: замерять пиковую память задач (отдельным прогоном теста)
+        verbose: печатать время выполнения каждой задачи
+    Returns:
+        список TaskRecord в порядке матрицы (тест, размер)
+    Raises:
+        ValueError: если общий блок не помещается в memory_budget
+    """
+    generator = generator or create_generators()
+    if not isinstance(sample_sizes, dict):
+        sample_sizes = {test: sample_sizes for test in tests}
+    tasks = [(test, size) for test in tests for size in sample_sizes[test]]
+    params = (generator.N, generator.a, generator.c, generator.initial_x0)
+    if not tasks:
+        return []
+    workers = workers or os.cpu_count() or 1
+    length = max(size for _, size in tasks)
+    shared_bytes = max(length, 1) * np.dtype(np.uint64).itemsize
+    if shared_bytes >= memory_budget:
+        raise ValueError(f"Общий блок из {length} значений ({shared_bytes} байт) "
+                         f"не помещается в memory_budget = {memory_budget} байт")
+
+    records = {}
+    pending = list(tasks)
+    running = {}
+    shm = shared_memory.SharedMemory(create=True, size=shared_bytes)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            source = MCG(*params)
+            source.jump(offset)
+            fill_shared(shm.name, length, source, executor, workers)
+
+            while pending or running:
+                in_use = shared_bytes + sum(estimate for _, estimate in running.values())
+                while pending:
+                    test, size = pending[0]
+                    estimate = estimate_memory(test, size, chunk_size)
+                    # Хотя бы одна задача запускается всегда, даже сверх бюджета
+                    if running and in_use + estimate > memory_budget:
+                        break
+                    pending.pop(0)
+                    future = executor.submit(_run_task, test, size, shm.name, length, *params,
+                                             offset, chunk_size, memory)
+                    running[future] = ((test, size), estimate)
+                    in_use += estimate
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, _ = running.pop(future)
+                    record = future.result()
+                    records[key] = record
+                    if verbose:
+                        print(f"{record.test} (n={record.sample_size}): {record.elapsed:.3f} с, "
+                              f"пик памяти {record.peak_memory / 2 ** 20:.1f} МиБ")
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return [records[key] for key in tasks]
+
+
+if __name__ == "__main__":
+    # Та же матрица, что и в блоках __main__ скриптов из tests/
+    matrix = {
+        'series': [1000, 10000, 100000],
+        'acf': [10000, 100000],
+        'histogram': [10000, 100000],
+        'runs': [10000, 100000],
+        'plane': [1000, 10000],
+        'linear_complexity': [100],
+    }
+    start_time = time.perf_counter()
+    results = run_matrix(list(matrix), matrix)
+    print(f"\nВсего задач: {len(results)}, общее время: {time.perf_counter() - start_time:.2f} с")
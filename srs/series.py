@@ -0,0 +1,112 @@
+import numpy as np
+from scipy import stats
+
+from srs.bits import bit_window
+from srs.profiling import profiled
+
+MAX_SERIES_LENGTH = 24
+
+# Число единичных битов в каждом значении байта
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+
+class SeriesCounter:
+    """
+    Накопитель частот битов и k-битовых серий в двоичной записи чисел
+
+    Серии, как и в исходном тесте, считаются внутри окна из width битов
+    каждого числа и не переходят через границу между числами. Для каждого
+    положения окно сдвигается на нужное число битов, коды серий считаются
+    np.bincount, поэтому стоимость не зависит от 2^k. Накопители по разным
+    блокам объединяются методом merge().
+    """
+
+    def __init__(self, k=3, width=31, shift=0):
+        """
+        Args:
+            k: длина серии
+            width: число битов, берущихся из каждого числа
+            shift: номер младшего бита окна (см. srs.bits.bit_window)
+        """
+        if not 1 <= k <= min(width, MAX_SERIES_LENGTH):
+            raise ValueError(f"Длина серии должна быть от 1 до {min(width, MAX_SERIES_LENGTH)}")
+        self.k = k
+        self.width = width
+        self.shift = shift
+        self.bit_counts = np.zeros(2, dtype=np.int64)
+        self.series_counts = np.zeros(2 ** k, dtype=np.int64)
+        self.total_bits = 0
+
+    @profiled(count='values')
+    def update(self, values):
+        """Добавляет очередной блок чисел"""
+        window = bit_window(values, self.width, self.shift)
+        mask = np.uint64(2 ** self.k - 1)
+
+        # Серии всех положений внутри окна: младший бит серии - low_bit
+        for low_bit in range(self.width - self.k + 1):
+            codes = ((window >> np.uint64(low_bit)) & mask).astype(np.intp)
+            self.series_counts += np.bincount(codes, minlength=2 ** self.k)
+
+        # view() требует непрерывного массива: при width=64, shift=0 окно - срез values
+        ones = int(_POPCOUNT[np.ascontiguousarray(window).view(np.uint8)].sum(dtype=np.int64))
+        total = len(window) * self.width
+        self.bit_counts += [total - ones, ones]
+        self.total_bits += total
+        return self
+
+    def merge(self, other):
+        """Добавляет частоты другого накопителя с теми же параметрами"""
+        if (other.k, other.width, other.shift) != (self.k, self.width, self.shift):
+            raise ValueError("Объединяемые накопители должны иметь одинаковые k, width и shift")
+        self.bit_counts += other.bit_counts
+        self.series_counts += other.series_counts
+        self.total_bits += other.total_bits
+        return self
+
+    @property
+    def total_series(self):
+        """Общее число просмотренных серий"""
+        return int(self.series_counts.sum())
+
+    def chi_square(self):
+        """
+        Хи-квадрат статистики для отдельных битов и для серий длины k
+
+        Returns:
+            (chi_square_bits, chi_square_series)
+        """
+        expected_bit_count = self.total_bits / 2
+        chi_square_bits = float(np.sum((self.bit_counts - expected_bit_count) ** 2)
+                                / expected_bit_count)
+        expected_series_count = self.total_series / 2 ** self.k
+        chi_square_series = float(np.sum((self.series_counts - expected_series_count) ** 2)
+                                  / expected_series_count)
+        return chi_square_bits, chi_square_series
+
+    @profiled()
+    def result(self):
+        chi_square_bits, chi_square_series = self.chi_square()
+        return {
+            'k': self.k,
+            'total_bits': self.total_bits,
+            'bit_counts': self.bit_counts.copy(),
+            'series_counts': self.series_counts.copy(),
+            'chi_square_bits': chi_square_bits,
+            'chi_square_bits_p_value': float(stats.chi2.sf(chi_square_bits, 1)),
+            'chi_square_series': chi_square_series,
+            'chi_square_series_p_value': float(stats.chi2.sf(chi_square_series, 2 ** self.k - 1)),
+        }
+
+
+def count_series(sequence, k=3, width=31, chunk_size=1 << 20):
+    """
+    Подсчитывает частоты битов и серий длины k для последовательности чисел
+
+    Returns:
+        SeriesCounter с накопленными частотами
+    """
+    counter = SeriesCounter(k, width)
+    for start in range(0, len(sequence), chunk_size):
+        counter.update(sequence[start:start + chunk_size])
+    return counter
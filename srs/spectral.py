@@ -0,0 +1,209 @@
+import math
+from dataclasses import dataclass
+
+# Константы Эрмита: gamma_t^t для t = 2..8 (плотнейшие решетки)
+HERMITE_POWERS = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+DEFAULT_DIMENSIONS = range(2, 9)
+
+
+@dataclass
+class SpectralResult:
+    """Результат спектрального теста в размерности t"""
+    dimension: int
+    nu_squared: int  # квадрат длины кратчайшего вектора двойственной решетки
+    vector: tuple  # сам кратчайший вектор (s_1, ..., s_t)
+    nu: float  # nu_t; 1 / nu_t - расстояние между соседними гиперплоскостями
+    merit: float  # мера Кнута mu_t = pi^(t/2) nu_t^t / ((t/2)! N)
+    score: float  # nu_t / (gamma_t^(1/2) N^(1/t)) из (0, 1], 1 - наилучшая решетка
+
+
+def dual_basis(a, N, t):
+    """
+    Базис двойственной решетки {s : s_1 + a s_2 + ... + a^(t-1) s_t = 0 mod N}
+
+    Точки (x_i, x_(i+1), ..., x_(i+t-1)) / N генератора лежат на семействах
+    гиперплоскостей, нормали к которым - векторы этой решетки.
+    """
+    basis = [[N] + [0] * (t - 1)]
+    power = 1
+    for j in range(1, t):
+        power = power * a % N
+        row = [0] * t
+        row[0] = -power
+        row[j] = 1
+        basis.append(row)
+    return basis
+
+
+def lll_reduce(basis):
+    """
+    LLL-редукция (delta = 3/4) целочисленного базиса в точной целой арифметике
+    (алгоритм 2.6.7 из книги Коэна). Возвращает новый список векторов.
+    """
+    b = [None] + [list(row) for row in basis]
+    n = len(basis)
+    d = [1] + [0] * n
+    lam = [[0] * (n + 1) for _ in range(n + 1)]
+
+    def dot(u, v):
+        return sum(x * y for x, y in zip(u, v))
+
+    def reduce(k, l):
+        if 2 * abs(lam[k][l]) > d[l]:
+            q = (2 * lam[k][l] + d[l]) // (2 * d[l])
+            b[k] = [x - q * y for x, y in zip(b[k], b[l])]
+            lam[k][l] -= q * d[l]
+            for i in range(1, l):
+                lam[k][i] -= q * lam[l][i]
+
+    def swap(k, k_max):
+        b[k], b[k - 1] = b[k - 1], b[k]
+        for j in range(1, k - 1):
+            lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+        mu = lam[k][k - 1]
+        new_d = (d[k - 2] * d[k] + mu * mu) // d[k - 1]
+        for i in range(k + 1, k_max + 1):
+            t = lam[i][k]
+            lam[i][k] = (d[k] * lam[i][k - 1] - mu * t) // d[k - 1]
+            lam[i][k - 1] = (new_d * t + mu * lam[i][k]) // d[k]
+        d[k - 1] = new_d
+
+    d[1] = dot(b[1], b[1])
+    k, k_max = 2, 1
+    while k <= n:
+        if k > k_max:
+            # Приращение ортогонализации Грама-Шмидта
+            k_max = k
+            for j in range(1, k + 1):
+                u = dot(b[k], b[j])
+                for i in range(1, j):
+                    u = (d[i] * u - lam[k][i] * lam[j][i]) // d[i - 1]
+                if j < k:
+                    lam[k][j] = u
+                else:
+                    if u == 0:
+                        raise ValueError("Векторы базиса линейно зависимы")
+                    d[k] = u
+
+        reduce(k, k - 1)
+        if 4 * d[k] * d[k - 2] < 3 * d[k - 1] ** 2 - 4 * lam[k][k - 1] ** 2:
+            swap(k, k_max)
+            k = max(2, k - 1)
+        else:
+            for l in range(k - 2, 0, -1):
+                reduce(k, l)
+            k += 1
+
+    return b[1:]
+
+
+def shortest_vector(basis):
+    """
+    Кратчайший ненулевой вектор решетки перебором Финке-Поста по
+    LLL-редуцированному базису
+
+    Returns:
+        (квадрат длины, вектор)
+    """
+    basis = lll_reduce(basis)
+    n = len(basis)
+
+    # Ортогонализация Грама-Шмидта в числах с плавающей точкой: после
+    # редукции координаты малы, а кандидаты проверяются точно
+    ortho = []
+    mu = [[0.0] * n for _ in range(n)]
+    norms = []
+    for i, vector in enumerate(basis):
+        v = [float(x) for x in vector]
+        for j in range(i):
+            mu[i][j] = sum(x * y for x, y in zip(vector, ortho[j])) / norms[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, ortho[j])]
+        ortho.append(v)
+        norms.append(sum(x * x for x in v))
+
+    best_vector = min(basis, key=lambda vector: sum(x * x for x in vector))
+    best = sum(x * x for x in best_vector)
+    coefficients = [0] * n
+
+    def enumerate_level(level, partial):
+        nonlocal best, best_vector
+        center = -sum(mu[j][level] * coefficients[j] for j in range(level + 1, n))
+        radius = math.sqrt(max(best * (1 + 1e-9) - partial, 0.0) / norms[level])
+        for x in range(math.ceil(center - radius), math.floor(center + radius) + 1):
+            coefficients[level] = x
+            length = partial + (x - center) ** 2 * norms[level]
+            if length > best * (1 + 1e-9):
+                continue
+            if level:
+                enumerate_level(level - 1, length)
+            elif any(coefficients):
+                vector = [sum(c * row[i] for c, row in zip(coefficients, basis)) for i in range(n)]
+                exact = sum(x * x for x in vector)
+                if 0 < exact < best:
+                    best, best_vector = exact, vector
+        coefficients[level] = 0
+
+    enumerate_level(n - 1, 0.0)
+    return best, tuple(best_vector)
+
+
+def spectral_test(a, N, dimensions=DEFAULT_DIMENSIONS):
+    """
+    Точный спектральный тест множителя a по модулю N без генерации выборки
+
+    Args:
+        a: множитель
+        N: модуль (для c = 0 и N = 2^e с a = 3 или 5 mod 8 Кнут рекомендует
+            брать N / 4 - период нечетных значений)
+        dimensions: размерности t (от 2 до 8)
+    Returns:
+        список SpectralResult по размерностям
+    """
+    results = []
+    for t in dimensions:
+        nu_squared, vector = shortest_vector(dual_basis(a, N, t))
+        nu = math.sqrt(nu_squared)
+        merit = math.pi ** (t / 2) * nu ** t / (math.gamma(t / 2 + 1) * N)
+        score = nu / (HERMITE_POWERS[t] ** (1 / (2 * t)) * N ** (1 / t))
+        results.append(SpectralResult(t, nu_squared, vector, nu, merit, score))
+    return results
+
+
+def screen_multipliers(N, multipliers, dimensions=DEFAULT_DIMENSIONS):
+    """
+    Отбор множителей по спектральному тесту
+
+    Returns:
+        список (a, минимальная нормированная оценка, результаты) по убыванию оценки
+    """
+    ranked = []
+    for a in multipliers:
+        results = spectral_test(a, N, dimensions)
+        ranked.append((a, min(result.score for result in results), results))
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    return ranked
+
+
+if __name__ == "__main__":
+    import time
+
+    from srs.mcg import create_generators
+
+    generator = create_generators()
+    start_time = time.perf_counter()
+    results = spectral_test(generator.a, generator.N)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Спектральный тест для a = {generator.a}, N = {generator.N} ({elapsed * 1000:.1f} мс):")
+    for result in results:
+        print(f"t = {result.dimension}: nu = {result.nu:.1f}, "
+              f"расстояние между гиперплоскостями = {1 / result.nu:.3e}, "
+              f"mu = {result.merit:.3e}, оценка = {result.score:.4f}, вектор = {result.vector}")
+
+    start_time = time.perf_counter()
+    ranked = screen_multipliers(generator.N, range(2 ** 16 + 3, 2 ** 16 + 3 + 8 * 1000, 8))
+    elapsed = time.perf_counter() - start_time
+    print(f"\nОтбор 1000 множителей: {elapsed:.2f} с")
+    for a, score, _ in ranked[:5]:
+        print(f"a = {a}: минимальная оценка = {score:.4f}")
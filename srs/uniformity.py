@@ -0,0 +1,167 @@
+import numpy as np
+from scipy import stats
+
+from srs.profiling import profiled
+
+DEFAULT_FINE_BINS = 1 << 16
+
+
+class UniformityAccumulator:
+    """
+    Потоковая проверка равномерности нормализованных значений x / N на [0, 1)
+
+    Хранит только счетчики по интервалам: грубые (для гистограммы и
+    критерия хи-квадрат) и мелкие (для критерия Колмогорова-Смирнова),
+    поэтому память не зависит от объема выборки. Среднее и дисперсия
+    обновляются по Уэлфорду (с объединением блоков по формуле Чана), так что
+    накопители разных блоков и процессов объединяются методом merge().
+    """
+
+    def __init__(self, N, num_bins=50, fine_bins=DEFAULT_FINE_BINS):
+        """
+        Args:
+            N: модуль генератора (значения нормализуются делением на N)
+            num_bins: число интервалов гистограммы и критерия хи-квадрат
+            fine_bins: число интервалов для критерия Колмогорова-Смирнова;
+                статистика известна с точностью порядка 1 / fine_bins
+        """
+        self.N = N
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+        self.fine_counts = np.zeros(fine_bins, dtype=np.int64)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # сумма квадратов отклонений от среднего
+        self.min = np.inf
+        self.max = -np.inf
+
+    @profiled(count='values')
+    def update(self, values):
+        """Добавляет очередной блок значений генератора"""
+        normalized = np.asarray(values, dtype=np.float64) / self.N
+        if not len(normalized):
+            return self
+        self.counts += _bin_counts(normalized, len(self.counts))
+        self.fine_counts += _bin_counts(normalized, len(self.fine_counts))
+
+        mean = float(normalized.mean())
+        m2 = float(np.sum((normalized - mean) ** 2))
+        self._combine(len(normalized), mean, m2)
+        self.min = min(self.min, float(normalized.min()))
+        self.max = max(self.max, float(normalized.max()))
+        return self
+
+    def merge(self, other):
+        """Добавляет счетчики и статистики другого накопителя с теми же параметрами"""
+        if (other.N, len(other.counts), len(other.fine_counts)) != \
+                (self.N, len(self.counts), len(self.fine_counts)):
+            raise ValueError("Объединяемые накопители должны иметь одинаковые N и число интервалов")
+        if not other.count:
+            return self
+        self.counts += other.counts
+        self.fine_counts += other.fine_counts
+        self._combine(other.count, other.mean, other._m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _combine(self, count, mean, m2):
+        """Объединение среднего и суммы квадратов отклонений (Чан и др.)"""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        """Дисперсия (смещенная, как np.var); NaN для пустой выборки"""
+        return self._m2 / self.count if self.count else np.nan
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.variance))
+
+    def density(self):
+        """Высоты гистограммы плотности по num_bins интервалам (как plt.hist(density=True))"""
+        return self.counts * len(self.counts) / self.count
+
+    def chi_square(self):
+        """
+        Критерий хи-квадрат по num_bins интервалам
+
+        Returns:
+            (статистика, p-значение)
+        """
+        expected = self.count / len(self.counts)
+        statistic = float(np.sum((self.counts - expected) ** 2) / expected)
+        return statistic, float(stats.chi2.sf(statistic, len(self.counts) - 1))
+
+    def ks_bounds(self):
+        """
+        Точные границы статистики Колмогорова-Смирнова D = sup |F_n(x) - x|
+
+        На границах мелких интервалов F_n известна точно, что дает нижнюю
+        границу; внутри интервала [e_j, e_(j+1)) F_n заключена между значениями
+        на его концах, что дает верхнюю.
+
+        Returns:
+            (нижняя граница, верхняя граница)
+        """
+        bins = len(self.fine_counts)
+        edges = np.arange(bins + 1) / bins
+        cumulative = np.concatenate([[0], np.cumsum(self.fine_counts)]) / self.count
+        lower = float(np.max(np.abs(cumulative - edges)))
+        upper = float(max(np.max(cumulative[1:] - edges[:-1]), np.max(edges[1:] - cumulative[:-1])))
+        return lower, upper
+
+    def ks_statistic(self, exact_bounds=False):
+        """
+        Критерий Колмогорова-Смирнова по мелким интервалам
+
+        Args:
+            exact_bounds: вернуть интервалы для статистики и p-значения
+                вместо оценки по границам интервалов
+        Returns:
+            (статистика, p-значение) или, при exact_bounds,
+            ((нижняя, верхняя граница D), (нижняя, верхняя граница p-значения))
+        """
+        lower, upper = self.ks_bounds()
+        if exact_bounds:
+            return (lower, upper), (float(stats.kstwo.sf(upper, self.count)),
+                                    float(stats.kstwo.sf(lower, self.count)))
+        return lower, float(stats.kstwo.sf(lower, self.count))
+
+    @profiled()
+    def result(self):
+        if not self.count:
+            # Пустая выборка: статистики не определены
+            return {
+                'sample_size': 0,
+                'mean': np.nan,
+                'std': np.nan,
+                'min': self.min,
+                'max': self.max,
+                **dict.fromkeys(['chi_square', 'chi_square_p_value', 'ks_statistic',
+                                 'ks_statistic_upper', 'ks_p_value', 'ks_p_value_lower'], np.nan),
+            }
+        chi_square, chi_square_p = self.chi_square()
+        (ks_lower, ks_upper), (p_lower, p_upper) = self.ks_statistic(exact_bounds=True)
+        return {
+            'sample_size': self.count,
+            'mean': self.mean,
+            'std': self.std,
+            'min': self.min,
+            'max': self.max,
+            'chi_square': chi_square,
+            'chi_square_p_value': chi_square_p,
+            'ks_statistic': ks_lower,
+            'ks_statistic_upper': ks_upper,
+            'ks_p_value': p_upper,
+            'ks_p_value_lower': p_lower,
+        }
+
+
+def _bin_counts(normalized, bins):
+    """Число значений из [0, 1) в каждом из bins равных интервалов"""
+    indices = np.minimum((normalized * bins).astype(np.intp), bins - 1)
+    return np.bincount(indices, minlength=bins)
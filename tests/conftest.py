@@ -0,0 +1,13 @@
+import pytest
+
+import srs.cache
+from srs.cache import SequenceCache
+
+
+@pytest.fixture(autouse=True, scope='session')
+def isolated_sequence_cache(tmp_path_factory):
+    """cached_sequence() в тестах пишет во временный каталог сессии, а не в общий кэш"""
+    previous = srs.cache._default_cache
+    srs.cache._default_cache = SequenceCache(tmp_path_factory.mktemp('mcg_cache'))
+    yield srs.cache._default_cache
+    srs.cache._default_cache = previous
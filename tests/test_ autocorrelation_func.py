@@ -1,71 +1,38 @@
-import matplotlib
-
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
+from srs.acf import StreamingACF
+from srs.cache import cached_sequence
 from srs.mcg import create_generators
+from srs.plotting import output
 
 
-def calculate_acf(sequence, max_lag=50):
+def run_autocorrelation(sequence_length=10000, max_lag=50, chunk_size=2 ** 20,
+                         plot=None, save=False):
     """
-    Вычисляет автокорреляционную функцию для последовательности
+    Выполняет тест автокорреляции для последовательности
+
+    Последовательность обрабатывается блоками по chunk_size значений,
+    поэтому целиком в памяти не хранится
 
     Args:
-        sequence: исследуемая последовательность
-        max_lag: максимальное значение сдвига
+        plot: строить график (None - если не задана переменная MCG_NO_PLOT)
+        save: сохранить массивы графика в .npz для отложенной отрисовки
     Returns:
-        acf: массив значений автокорреляции для разных сдвигов
-    """
-    # Нормализация последовательности
-    sequence = np.array(sequence)
-    n = len(sequence)
-    mean = np.mean(sequence)
-    var = np.var(sequence)
-    normalized_seq = (sequence - mean) / np.sqrt(var)
-
-    # Вычисление ACF для разных сдвигов
-    acf = np.zeros(max_lag + 1)
-    for lag in range(max_lag + 1):
-        # Вычисление корреляции для текущего сдвига
-        acf[lag] = np.sum(normalized_seq[:(n - lag)] * normalized_seq[lag:]) / n
-
-    return acf
-
-
-def test_autocorrelation(sequence_length=10000, max_lag=50):
-    """
-    Выполняет тест автокорреляции для последовательности
+        словарь результатов StreamingACF.result()
     """
     generator = create_generators()
-    sequence = generator.generate_sequence(sequence_length)
+    sequence = cached_sequence(sequence_length, generator)
 
-    # Вычисляем ACF
-    acf = calculate_acf(sequence, max_lag)
+    # Вычисляем ACF потоково
+    accumulator = StreamingACF(max_lag, shift=generator.N / 2)
+    for start in range(0, sequence_length, chunk_size):
+        accumulator.update(sequence[start:start + chunk_size])
+    acf = accumulator.acf()
 
     # Вычисляем доверительные интервалы (95%)
     confidence_interval = 1.96 / np.sqrt(sequence_length)
 
-    # Создаем график
-    plt.figure(figsize=(12, 6))
-    lags = np.arange(max_lag + 1)
-
-    # Основной график ACF
-    plt.stem(lags, acf, basefmt='b-', linefmt='b-', markerfmt='bo', label='ACF')
-
-    # Добавляем доверительные интервалы
-    plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    plt.axhline(y=confidence_interval, color='r', linestyle='--', alpha=0.5,
-                label='95% доверительный интервал')
-    plt.axhline(y=-confidence_interval, color='r', linestyle='--', alpha=0.5)
-
-    plt.title('Автокорреляционная функция')
-    plt.xlabel('Сдвиг (lag)')
-    plt.ylabel('ACF')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-
-    plt.savefig(f'autocorrelation_{sequence_length}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    output('autocorrelation', f'autocorrelation_{sequence_length}', plot, save,
+           acf=acf, confidence_interval=confidence_interval)
 
     # Анализ результатов
     print(f"\nАнализ автокорреляции (длина последовательности: {sequence_length}):")
@@ -81,8 +48,17 @@ def test_autocorrelation(sequence_length=10000, max_lag=50):
     else:
         print("\nЗначимых корреляций не обнаружено")
 
+    return accumulator.result()
+
+
+def test_autocorrelation():
+    """Проверка для pytest без графиков: ACF на нулевом сдвиге равна 1"""
+    result = run_autocorrelation(plot=False)
+    assert len(result['acf']) == result['max_lag'] + 1
+    assert np.isclose(result['acf'][0], 1.0)
+
 
 if __name__ == "__main__":
     # Тестируем с разными размерами последовательности
-    test_autocorrelation(10000)
-    test_autocorrelation(100000)
\ No newline at end of file
+    run_autocorrelation(10000)
+    run_autocorrelation(100000)
\ No newline at end of file
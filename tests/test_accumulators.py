@@ -0,0 +1,168 @@
+import numpy as np
+import pytest
+
+from srs.acf import StreamingACF, calculate_acf
+from srs.linear_complexity import LinearComplexityAccumulator, linear_complexity_profile
+from srs.mcg import create_generators
+from srs.plane import PlaneAccumulator
+from srs.runs import RunsAccumulator
+from srs.series import SeriesCounter
+from srs.uniformity import UniformityAccumulator
+
+N = 2 ** 31
+LENGTH = 2000
+CHUNK_SIZES = [1, 7, 100, LENGTH - 1, LENGTH]
+
+
+@pytest.fixture(scope='module')
+def values():
+    return create_generators().generate_block(LENGTH)
+
+
+def feed(accumulator, values, chunk_size):
+    for start in range(0, len(values), chunk_size):
+        accumulator.update(values[start:start + chunk_size])
+    return accumulator.result()
+
+
+def assert_results_equal(result, expected):
+    """Целые значения и счетчики совпадают точно, вещественные - до ошибки округления"""
+    assert result.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, (float, np.floating)) or \
+                (isinstance(value, np.ndarray) and value.dtype.kind == 'f'):
+            assert np.allclose(result[key], value, rtol=1e-9, atol=1e-12), key
+        else:
+            assert np.array_equal(result[key], value), key
+
+
+# Накопители srs.battery.TESTS и их параметры
+ACCUMULATORS = {
+    'acf': lambda: StreamingACF(max_lag=20, shift=N / 2),
+    'series': lambda: SeriesCounter(k=3),
+    'runs': lambda: RunsAccumulator(),
+    'plane_2d': lambda: PlaneAccumulator(N, bins=16, dimension=2),
+    'plane_3d': lambda: PlaneAccumulator(N, bins=8, dimension=3),
+    'uniformity': lambda: UniformityAccumulator(N, num_bins=20, fine_bins=1024),
+    'linear_complexity': lambda: LinearComplexityAccumulator(max_bits=2000),
+}
+
+
+@pytest.mark.parametrize('name', ACCUMULATORS)
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_result_does_not_depend_on_chunking(values, name, chunk_size):
+    expected = feed(ACCUMULATORS[name](), values, LENGTH)
+    assert_results_equal(feed(ACCUMULATORS[name](), values, chunk_size), expected)
+
+
+@pytest.mark.parametrize('name', ['acf', 'series', 'uniformity'])
+def test_merge_of_adjacent_parts(values, name):
+    expected = feed(ACCUMULATORS[name](), values, LENGTH)
+    merged = ACCUMULATORS[name]()
+    for start, stop in [(0, 1), (1, 1234), (1234, 1240), (1240, LENGTH)]:
+        part = ACCUMULATORS[name]()
+        part.update(values[start:stop])
+        merged.merge(part)
+    assert_results_equal(merged.result(), expected)
+
+
+@pytest.mark.parametrize('name', ACCUMULATORS)
+def test_empty_result_is_defined(name):
+    # Статистики пустой выборки не определены (NaN), но result() не падает
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = ACCUMULATORS[name]().result()
+    if name in ('acf', 'uniformity'):
+        assert result['sample_size'] == 0
+        assert np.isnan(result['max_abs_acf' if name == 'acf' else 'chi_square'])
+
+
+def test_streaming_acf_matches_direct(values):
+    accumulator = StreamingACF(max_lag=30)
+    feed(accumulator, values, 333)
+    for method in ('direct', 'fft'):
+        assert np.allclose(accumulator.acf(), calculate_acf(values, 30, method))
+
+
+def test_runs_histograms_match_scan(values):
+    runs = RunsAccumulator()
+    runs.update(values)
+    increasing, decreasing = runs.histograms()
+
+    # Участки монотонности перебором: соседние участки делят общую точку
+    lengths = {True: [], False: []}
+    direction, length = None, 1
+    for previous, current in zip(values[:-1], values[1:]):
+        up = bool(current > previous)
+        if up != direction and direction is not None:
+            lengths[direction].append(length)
+            length = 1
+        direction, length = up, length + 1
+    lengths[direction].append(length)
+
+    assert increasing.tolist() == np.bincount(lengths[True], minlength=len(increasing)).tolist()
+    assert decreasing.tolist() == np.bincount(lengths[False], minlength=len(decreasing)).tolist()
+
+
+def test_series_counts_match_string_scan(values):
+    counter = SeriesCounter(k=3)
+    counter.update(values[:300])
+    bits = ''.join(format(int(value), '031b') for value in values[:300])
+    series = [0] * 8
+    for start in range(0, len(bits), 31):
+        word = bits[start:start + 31]
+        for i in range(31 - 3 + 1):
+            series[int(word[i:i + 3], 2)] += 1
+    assert counter.bit_counts.tolist() == [bits.count('0'), bits.count('1')]
+    assert counter.series_counts.tolist() == series
+
+
+def test_series_counter_accepts_strided_values(values):
+    # При width=64, shift=0 окно совпадает с самим (несмежным) срезом
+    strided = values.astype(np.uint64)[::3]
+    counter = SeriesCounter(k=2, width=64).update(strided)
+    ones = sum(bin(int(value)).count('1') for value in strided)
+    assert counter.bit_counts.tolist() == [64 * len(strided) - ones, ones]
+
+
+def berlekamp_massey_profile(bits):
+    """Алгоритм Берлекампа-Мэсси на списках (эталон для профиля)"""
+    n = len(bits)
+    c, b = [1] + [0] * n, [1] + [0] * n
+    L, m, profile = 0, -1, []
+    for i in range(n):
+        d = bits[i]
+        for j in range(1, L + 1):
+            d ^= c[j] & bits[i - j]
+        if d:
+            t = c[:]
+            for j in range(n + 1 - (i - m)):
+                c[j + i - m] ^= b[j]
+            if 2 * L <= i:
+                L, m, b = i + 1 - L, i, t
+        profile.append(L)
+    return profile
+
+
+def linear_complexity_cases():
+    rng = np.random.default_rng(1)
+    period = rng.integers(0, 2, 37)
+    jump = np.zeros(600, dtype=np.uint8)
+    jump[400] = 1
+    jump[500:] = rng.integers(0, 2, 100)
+    return {
+        'random': rng.integers(0, 2, 1500),
+        'periodic': np.tile(period, 40),
+        'periodic_then_random': np.concatenate([np.tile(period, 20), rng.integers(0, 2, 300),
+                                                np.tile(period, 10)]),
+        'zeros_then_one': jump,
+        'empty': np.zeros(0, dtype=np.uint8),
+    }
+
+
+@pytest.mark.parametrize('case', linear_complexity_cases())
+@pytest.mark.parametrize('word_threshold', [1, 50, 1 << 15])
+def test_linear_complexity_profile_matches_reference(monkeypatch, case, word_threshold):
+    # word_threshold - длина LFSR, с которой вычисления переходят на слова uint64
+    monkeypatch.setattr('srs.linear_complexity.WORD_THRESHOLD', word_threshold)
+    bits = linear_complexity_cases()[case]
+    assert linear_complexity_profile(bits).tolist() == berlekamp_massey_profile(bits.tolist())
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from srs.backends import (GenericBackend, ModularBackend, PowerOfTwoBackend, TwoLimbBackend,
+                          select_backend)
+from srs.mcg import MCG
+
+# Модуль, ожидаемый способ вычислений и параметры генератора
+CASES = [
+    (2 ** 31, PowerOfTwoBackend, 1103515245, 12345, 42),
+    (2 ** 64, PowerOfTwoBackend, 6364136223846793005, 1442695040888963407, 1),
+    (2 ** 100, TwoLimbBackend, 2 ** 99 + 2 ** 61 + 12345, 987654321, 3),
+    (2 ** 128, TwoLimbBackend, 0x2360ED051FC65DA44385DF649FCCF645, 0x5851F42D4C957F2D, 7),
+    (2 ** 31 - 1, ModularBackend, 16807, 0, 1),
+    (2 ** 64 + 13, GenericBackend, 2 ** 63 + 5, 11, 2 ** 64),
+]
+
+
+def scan(generator, count):
+    return [generator.next() for _ in range(count)]
+
+
+@pytest.mark.parametrize('N, backend, a, c, x0', CASES)
+def test_select_backend(N, backend, a, c, x0):
+    assert type(select_backend(N)) is backend
+
+
+@pytest.mark.parametrize('N, backend, a, c, x0', CASES)
+@pytest.mark.parametrize('block_size', [1, 3, 64])
+def test_generate_block_matches_next(N, backend, a, c, x0, block_size):
+    generator = MCG(N, a, c, x0)
+    reference = scan(MCG(N, a, c, x0), 300)
+    assert [int(value) for value in generator.generate_block(300, block_size)] == reference
+    assert generator.current == reference[-1]
+
+
+@pytest.mark.parametrize('N, backend, a, c, x0', [case for case in CASES if case[1] is TwoLimbBackend])
+@pytest.mark.parametrize('block_size', [1, 5, 64])
+def test_generate_limbs_matches_next(N, backend, a, c, x0, block_size):
+    generator = MCG(N, a, c, x0)
+    reference = scan(MCG(N, a, c, x0), 200)
+    high, low = generator.generate_limbs(200, block_size)
+    assert high.dtype == low.dtype == np.uint64
+    assert [int(h) << 64 | int(l) for h, l in zip(high, low)] == reference
+    assert generator.current == reference[-1]
+
+
+def test_generate_limbs_requires_two_limb_modulus():
+    with pytest.raises(ValueError):
+        MCG(2 ** 31, 11, 0, 11).generate_limbs(10)
+
+
+def test_power_of_two_next_masks_state():
+    # Для N = 2^k next() использует маску вместо деления с остатком
+    generator = MCG(2 ** 64, 2 ** 64 - 1, 2 ** 64 - 1, 2 ** 64 - 1)
+    assert scan(generator, 3) == [0, 2 ** 64 - 1, 0]
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from srs.batch import MCGBatch
+from srs.mcg import MCG
+
+# Потоки с разными модулями, множителями, приращениями и начальными значениями
+NARROW = [(2 ** 31, 11, 0, 11), (2 ** 31, 1103515245, 12345, 5), (2 ** 31 - 1, 16807, 0, 1),
+          (1000, 21, 7, 3), (2 ** 32, 69069, 1, 2 ** 32 + 9)]
+WIDE = NARROW + [(2 ** 64, 6364136223846793005, 1, 7), (2 ** 100, 2 ** 99 + 5, 3, 1)]
+
+
+def make(streams):
+    N, a, c, x0 = zip(*streams)
+    return MCGBatch(N, a, c, x0), [MCG(*params) for params in streams]
+
+
+@pytest.mark.parametrize('streams', [NARROW, WIDE])
+def test_dtype_depends_on_moduli(streams):
+    batch, _ = make(streams)
+    assert batch.dtype == (np.uint64 if streams is NARROW else object)
+
+
+@pytest.mark.parametrize('streams', [NARROW, WIDE])
+def test_next_and_generate_match_generators(streams):
+    batch, generators = make(streams)
+    for _ in range(5):
+        assert [int(value) for value in batch.next()] == [g.next() for g in generators]
+
+    values = batch.generate(50)
+    assert values.shape == (50, len(streams))
+    reference = [[g.next() for g in generators] for _ in range(50)]
+    assert [[int(value) for value in row] for row in values] == reference
+
+
+@pytest.mark.parametrize('streams', [NARROW, WIDE])
+def test_next_selected_streams(streams):
+    batch, generators = make(streams)
+    selected = [0, 2]
+    for _ in range(3):
+        batch.next(selected)
+    for index in selected:
+        for _ in range(3):
+            generators[index].next()
+    assert [int(value) for value in batch.state] == [g.current % g.N for g in generators]
+
+
+@pytest.mark.parametrize('streams', [NARROW, WIDE])
+def test_jump_skip_element_at_match_generators(streams):
+    batch, generators = make(streams)
+    steps = np.arange(len(streams)) * 37 + 3
+    assert [int(value) for value in batch.element_at(steps)] == \
+        [g.element_at(int(n)) for g, n in zip(generators, steps)]
+
+    batch.jump(100)
+    batch.skip(steps)
+    for g, n in zip(generators, steps):
+        g.jump(100)
+        g.skip(int(n))
+    assert [int(value) for value in batch.state] == [g.current for g in generators]
+
+    batch.reset(5, streams=[1])
+    generators[1].reset(5)
+    assert int(batch.state[1]) == generators[1].current
+
+
+def test_normalized_values_match_generators():
+    batch, generators = make(NARROW)
+    values = batch.generate_normalized(10)
+    reference = [[g.get_normalized_next() for g in generators] for _ in range(10)]
+    assert np.allclose(values, reference, rtol=0, atol=1e-15)
+
+
+def test_from_generators_and_generator_round_trip():
+    generators = [MCG(*params) for params in WIDE]
+    for g in generators:
+        g.skip(17)
+    batch = MCGBatch.from_generators(generators)
+    copies = [batch.generator(i) for i in range(len(batch))]
+    assert [g.next() for g in copies] == [g.next() for g in generators]
+    assert [int(value) for value in batch.next()] == [g.current for g in copies]
+
+
+def test_negative_steps_rejected():
+    batch, _ = make(NARROW)
+    with pytest.raises(ValueError):
+        batch.skip(-1)
+    with pytest.raises(ValueError):
+        batch.element_at(-1)
+    with pytest.raises(ValueError):
+        batch.element_at([0, 1, -1, 2, 3])
@@ -0,0 +1,129 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from srs.buffered import BufferedMCG, MCGRandom
+from srs.mcg import MCG
+
+PARAMS = [(2 ** 31, 11, 0, 11), (2 ** 31 - 1, 16807, 0, 1), (2 ** 64, 6364136223846793005, 1, 7),
+          (2 ** 100, 2 ** 99 + 5, 3, 1)]
+
+
+@pytest.mark.parametrize('params', PARAMS)
+@pytest.mark.parametrize('buffer_size', [1, 7, 64])
+def test_next_matches_mcg_across_buffer_boundaries(params, buffer_size):
+    buffered, reference = BufferedMCG(*params, buffer_size=buffer_size), MCG(*params)
+    for _ in range(3 * buffer_size + 5):
+        assert buffered.next() == reference.next()
+        assert buffered.current == reference.current
+
+
+@pytest.mark.parametrize('params', PARAMS)
+def test_normalized_matches_mcg(params):
+    buffered, reference = BufferedMCG(*params, buffer_size=10), MCG(*params)
+    values = [buffered.get_normalized_next() for _ in range(25)]
+    assert values == [reference.get_normalized_next() for _ in range(25)]
+
+
+@pytest.mark.parametrize('params', PARAMS)
+def test_reset_skip_jump_rebuild_buffer(params):
+    buffered, reference = BufferedMCG(*params, buffer_size=16), MCG(*params)
+    for method, argument in [('next', None), ('skip', 5), ('next', None), ('jump', 40),
+                             ('reset', 0), ('reset', 33), ('skip', 0), ('jump', 1000)]:
+        if argument is None:
+            assert buffered.next() == reference.next()
+        else:
+            getattr(buffered, method)(argument)
+            getattr(reference, method)(argument)
+        assert buffered.current == reference.current
+        assert [buffered.next() for _ in range(20)] == [reference.next() for _ in range(20)]
+
+
+def test_generate_block_after_buffered_draws():
+    buffered, reference = BufferedMCG(2 ** 31, 11, 0, 11, buffer_size=8), MCG(2 ** 31, 11, 0, 11)
+    for _ in range(5):
+        assert buffered.next() == reference.next()
+    assert buffered.generate_block(30).tolist() == reference.generate_block(30).tolist()
+    assert buffered.next() == reference.next()
+
+
+def test_from_generator_keeps_state():
+    generator = MCG(2 ** 31, 11, 0, 11)
+    generator.skip(12)
+    buffered = BufferedMCG.from_generator(generator, buffer_size=4)
+    assert [buffered.next() for _ in range(10)] == [generator.next() for _ in range(10)]
+
+
+@pytest.mark.parametrize('params', PARAMS)
+@pytest.mark.parametrize('clone', [pickle.loads, copy.deepcopy])
+def test_pickle_and_deepcopy(params, clone):
+    buffered, reference = BufferedMCG(*params, buffer_size=8), MCG(*params)
+    for _ in range(5):
+        assert buffered.next() == reference.next()
+    data = pickle.dumps(buffered) if clone is pickle.loads else buffered
+    copied = clone(data)
+    assert copied.buffer_size == 8 and copied.initial_x0 == buffered.initial_x0
+    assert [copied.next() for _ in range(20)] == [reference.next() for _ in range(20)]
+    assert buffered.current == MCG(*params).element_at(4)
+
+
+def test_random_pickle_round_trip():
+    rng = MCGRandom(5)
+    rng.random()
+    copied = pickle.loads(pickle.dumps(rng))
+    assert [copied.random() for _ in range(10)] == [rng.random() for _ in range(10)]
+
+
+def test_random_is_normalized_sequence():
+    rng = MCGRandom(3)
+    reference = MCG(2 ** 31, 11, 0, 11)
+    reference.reset(3)
+    assert [rng.random() for _ in range(10)] == [reference.get_normalized_next() for _ in range(10)]
+
+
+def test_random_keeps_generator_state():
+    generator, reference = MCG(2 ** 31, 11, 0, 11), MCG(2 ** 31, 11, 0, 11)
+    generator.skip(12)
+    reference.skip(12)
+    rng = MCGRandom(generator=generator)
+    assert [rng.random() for _ in range(10)] == [reference.get_normalized_next() for _ in range(10)]
+
+    rng.seed()
+    reference.reset(0)
+    assert rng.random() == reference.get_normalized_next()
+
+
+def test_random_below_one_for_wide_modulus():
+    # next() = 2^64 - 1, и (2^64 - 1) / 2^64 округляется до 1.0
+    rng = MCGRandom(generator=MCG(2 ** 64, 1, 2 ** 64 - 1, 0))
+    assert all(0 <= rng.random() < 1 for _ in range(10))
+
+
+@pytest.mark.parametrize('k', [1, 5, 31, 32, 100])
+def test_getrandbits_range(k):
+    rng = MCGRandom(7)
+    values = [rng.getrandbits(k) for _ in range(200)]
+    assert all(0 <= value < 2 ** k for value in values)
+
+
+def test_state_round_trip_and_random_api():
+    rng = MCGRandom(11)
+    rng.random()
+    state = rng.getstate()
+    first = [rng.random(), rng.randint(1, 6), rng.gauss(0, 1)]
+    rng.setstate(state)
+    assert [rng.random(), rng.randint(1, 6), rng.gauss(0, 1)] == first
+
+    items = list(range(20))
+    rng.shuffle(items)
+    assert sorted(items) == list(range(20))
+    assert isinstance(rng, random.Random)
+
+
+def test_seed_validation():
+    with pytest.raises(TypeError):
+        MCGRandom(-1)
+    with pytest.raises(TypeError):
+        MCGRandom('seed')
@@ -0,0 +1,97 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from srs.cache import HEADER, SequenceCache
+from srs.mcg import MCG
+
+PARAMS = (2 ** 31, 11, 0, 11)
+LENGTH = 1000
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SequenceCache(tmp_path)
+
+
+def reference(length, offset=0, params=PARAMS):
+    generator = MCG(*params)
+    generator.jump(offset)
+    return generator.generate_block(length)
+
+
+def corrupt(path, position, size=1):
+    """Инвертирует size байтов файла начиная с position"""
+    with open(path, 'r+b') as f:
+        f.seek(position)
+        data = f.read(size)
+        f.seek(position)
+        f.write(bytes(byte ^ 0xFF for byte in data))
+
+
+@pytest.mark.parametrize('offset, length', [(0, LENGTH), (123, LENGTH), (5, 0)])
+def test_sequence_matches_generator_and_is_reused(cache, offset, length):
+    values = cache.sequence(*PARAMS, length, offset)
+    assert values.dtype == np.uint32
+    assert values.tolist() == reference(length, offset).tolist()
+    assert cache.get(*PARAMS, offset, length).tolist() == values.tolist()
+    assert len(os.listdir(cache.directory)) == 1
+
+
+def test_header_crc_mismatch_invalidates_entry(cache):
+    cache.sequence(*PARAMS, LENGTH)
+    path = cache._path(cache._key(*PARAMS, 0, LENGTH))
+    corrupt(path, HEADER.size - 8)  # CRC32 данных в заголовке
+    assert cache.get(*PARAMS, 0, LENGTH) is None
+    assert not os.path.exists(path)
+    assert cache.sequence(*PARAMS, LENGTH).tolist() == reference(LENGTH).tolist()
+
+
+def test_key_mismatch_is_rejected(cache):
+    cache.sequence(*PARAMS, LENGTH)
+    other = (2 ** 31, 11, 0, 13)
+    shutil.copy(cache._path(cache._key(*PARAMS, 0, LENGTH)), cache._path(cache._key(*other, 0, LENGTH)))
+    assert cache.get(*other, 0, LENGTH) is None
+    assert cache.sequence(*other, LENGTH).tolist() == reference(LENGTH, params=other).tolist()
+
+
+def test_truncated_file_is_rejected(cache):
+    cache.sequence(*PARAMS, LENGTH)
+    path = cache._path(cache._key(*PARAMS, 0, LENGTH))
+    os.truncate(path, os.path.getsize(path) - 4)
+    assert cache.get(*PARAMS, 0, LENGTH) is None
+    assert not os.path.exists(path)
+
+
+def test_verify_detects_corrupted_data(cache):
+    cache.sequence(*PARAMS, LENGTH)
+    path = cache._path(cache._key(*PARAMS, 0, LENGTH))
+    corrupt(path, HEADER.size + 4 * 10)
+    # Без verify проверяется только заголовок
+    assert cache.get(*PARAMS, 0, LENGTH) is not None
+    assert cache.get(*PARAMS, 0, LENGTH, verify=True) is None
+    assert not os.path.exists(path)
+
+
+def test_max_bytes_evicts_least_recently_used(tmp_path):
+    entry_size = HEADER.size + 4 * LENGTH
+    cache = SequenceCache(tmp_path, max_bytes=2 * entry_size)
+    paths = []
+    for i, x0 in enumerate((1, 3, 5)):
+        cache.sequence(2 ** 31, 11, 0, x0, LENGTH)
+        paths.append(cache._path(cache._key(2 ** 31, 11, 0, x0, 0, LENGTH)))
+        os.utime(paths[-1], (1000 + i, 1000 + i))
+        if i == 1:
+            # Первый файл использован позже второго
+            assert cache.get(2 ** 31, 11, 0, 1, 0, LENGTH) is not None
+            os.utime(paths[0], (1002, 1002))
+
+    assert [os.path.exists(path) for path in paths] == [True, False, True]
+    assert cache.total_bytes() == 2 * entry_size
+
+
+def test_wide_modulus_rejected(cache):
+    with pytest.raises(ValueError):
+        cache.sequence(2 ** 64, 5, 1, 1, 10)
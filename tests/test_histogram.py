@@ -1,68 +1,73 @@
-import matplotlib
-
-matplotlib.use('Agg')  # Установка бэкенда 'Agg' до импорта pyplot
-import matplotlib.pyplot as plt
-import numpy as np
+from srs.cache import cached_sequence
 from srs.mcg import create_generators
+from srs.plotting import output
+from srs.uniformity import UniformityAccumulator
 
 
-def test_histogram_distribution(sample_size=10000, num_bins=50):
+def run_histogram_distribution(sample_size=10000, num_bins=50, chunk_size=2 ** 20,
+                                plot=None, save=False):
     """
     Тест распределения элементов последовательности с помощью гистограммы
 
+    Последовательность обрабатывается блоками: хранятся только счетчики
+    по интервалам, поэтому память не зависит от размера выборки
+
     Args:
         sample_size: размер выборки
         num_bins: количество интервалов для гистограммы
+        plot: строить график (None - если не задана переменная MCG_NO_PLOT)
+        save: сохранить массивы графика в .npz для отложенной отрисовки
+    Returns:
+        словарь результатов UniformityAccumulator.result()
     """
-    # Создаем генератор и получаем последовательность
+    # Получаем последовательность (из кэша, если она уже сгенерирована)
     generator = create_generators()
+    sequence = cached_sequence(sample_size, generator)
 
-    # Генерируем нормализованные числа (от 0 до 1)
-    sequence = [generator.get_normalized_next() for _ in range(sample_size)]
-
-    # Создаем гистограмму
-    plt.figure(figsize=(12, 6))
-
-    # Построение гистограммы
-    counts, bins, _ = plt.hist(sequence, bins=num_bins, density=True,
-                               alpha=0.7, color='blue', edgecolor='black')
-
-    # Добавляем линию равномерного распределения для сравнения
-    plt.axhline(y=1, color='r', linestyle='--', label='Идеальное равномерное распределение')
+    # Нормализация к [0, 1] и подсчет частот блоками
+    accumulator = UniformityAccumulator(generator.N, num_bins)
+    for start in range(0, sample_size, chunk_size):
+        accumulator.update(sequence[start:start + chunk_size])
 
-    # Вычисляем статистики
-    mean_val = np.mean(sequence)
-    std_val = np.std(sequence)
+    # Статистики (по Уэлфорду, за тот же проход)
+    mean_val = accumulator.mean
+    std_val = accumulator.std
 
-    # Добавляем подписи и информацию
-    plt.title(f'Гистограмма распределения {sample_size} элементов последовательности\n'
-              f'Среднее = {mean_val:.4f}, СКО = {std_val:.4f}')
-    plt.xlabel('Значение')
-    plt.ylabel('Плотность')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-
-    # Сохраняем график в файл
-    plt.savefig(f'histogram_{sample_size}.png')
-    plt.close()
+    # Гистограмма по накопленным счетчикам
+    output('histogram', f'histogram_{sample_size}', plot, save,
+           density=accumulator.density(), sample_size=sample_size, mean=mean_val, std=std_val)
 
     # Выводим статистику
     print(f"Статистические характеристики распределения:")
     print(f"Размер выборки: {sample_size}")
     print(f"Среднее значение: {mean_val:.4f}")
     print(f"Стандартное отклонение: {std_val:.4f}")
-    print(f"Минимальное значение: {min(sequence):.4f}")
-    print(f"Максимальное значение: {max(sequence):.4f}")
+    print(f"Минимальное значение: {accumulator.min:.4f}")
+    print(f"Максимальное значение: {accumulator.max:.4f}")
 
-    # Тест Колмогорова-Смирнова на равномерность
-    from scipy import stats
-    ks_statistic, p_value = stats.kstest(sequence, 'uniform')
+    # Тест Колмогорова-Смирнова на равномерность (по мелким интервалам)
+    (ks_lower, ks_upper), (p_lower, p_upper) = accumulator.ks_statistic(exact_bounds=True)
     print(f"\nТест Колмогорова-Смирнова:")
-    print(f"Статистика: {ks_statistic:.4f}")
+    print(f"Статистика: {ks_lower:.4f} (не более {ks_upper:.4f})")
+    print(f"P-значение: {p_upper:.4f} (не менее {p_lower:.4f})")
+
+    # Критерий хи-квадрат по интервалам гистограммы
+    chi_square, p_value = accumulator.chi_square()
+    print(f"\nКритерий хи-квадрат ({num_bins - 1} степеней свободы):")
+    print(f"Статистика: {chi_square:.4f}")
     print(f"P-значение: {p_value:.4f}")
 
+    return accumulator.result()
+
+
+def test_histogram_distribution():
+    """Проверка для pytest без графиков: p-значения определены и лежат в [0, 1]"""
+    result = run_histogram_distribution(plot=False)
+    assert 0 <= result['chi_square_p_value'] <= 1
+    assert 0 <= result['ks_p_value'] <= 1
+
 
 if __name__ == "__main__":
     # Запускаем тест с разными размерами выборки
-    test_histogram_distribution(10000)
-    test_histogram_distribution(100000)
\ No newline at end of file
+    run_histogram_distribution(10000)
+    run_histogram_distribution(100000)
\ No newline at end of file
@@ -1,9 +1,8 @@
-import matplotlib
-
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
-from srs.mcg import create_generators
+from srs.bits import unpack_bits
+from srs.cache import cached_sequence
+from srs.linear_complexity import linear_complexity, linear_complexity_profile
+from srs.plotting import output
 
 
 def berlekamp_massey(sequence):
@@ -11,64 +10,38 @@ def berlekamp_massey(sequence):
     Реализация алгоритма Берлекампа-Мэсси для вычисления линейной сложности
     последовательности
     """
-    n = len(sequence)
-    c = [0] * n  # текущий LFSR
-    b = [0] * n  # предыдущий LFSR
-    c[0], b[0] = 1, 1
-
-    L, m = 0, -1  # L - длина LFSR, m - последнее изменение
-
-    for i in range(n):
-        d = sequence[i]  # вычисление расхождения
-        for j in range(1, L + 1):
-            d ^= c[j] & sequence[i - j]
-
-        if d:  # если есть расхождение
-            t = c.copy()
-            for j in range(i - m):
-                if i - j < n:
-                    c[i - j] ^= b[j]
-            if L <= i // 2:
-                L = i + 1 - L
-                m = i
-                b = t
-
-    return L
+    return linear_complexity(sequence)
 
 
 def calculate_complexity_profile(sequence):
     """
     Вычисляет профиль линейной сложности для последовательности
-    """
-    n = len(sequence)
-    profile = []
 
-    for k in range(1, n + 1):
-        subsequence = sequence[:k]
-        complexity = berlekamp_massey(subsequence)
-        profile.append(complexity)
-
-    return profile
+    Профиль строится за один проход алгоритма Берлекампа-Мэсси:
+    длина LFSR после i-го шага равна сложности префикса длины i
+    """
+    return linear_complexity_profile(sequence)
 
 
 def binary_sequence_from_numbers(numbers, bits=31):
     """
     Преобразует последовательность чисел в битовую последовательность
+    (младшие bits битов каждого числа, от старшего к младшему)
     """
-    binary_sequence = []
-    for num in numbers:
-        # Преобразуем число в битовую строку и берем младшие биты
-        binary = format(num, f'0{bits}b')[-bits:]
-        binary_sequence.extend([int(b) for b in binary])
-    return binary_sequence
+    return unpack_bits(numbers, width=bits)
 
 
-def test_linear_complexity(sequence_length=1000):
+def run_linear_complexity(sequence_length=1000, plot=None, save=False):
     """
     Выполняет тест профиля линейной сложности
+
+    Args:
+        plot: строить график (None - если не задана переменная MCG_NO_PLOT)
+        save: сохранить массивы графика в .npz для отложенной отрисовки
+    Returns:
+        словарь с профилем, итоговой сложностью и средним отклонением
     """
-    generator = create_generators()
-    sequence = generator.generate_sequence(sequence_length)
+    sequence = cached_sequence(sequence_length)
 
     # Преобразуем в битовую последовательность
     binary_sequence = binary_sequence_from_numbers(sequence)
@@ -76,24 +49,8 @@ def test_linear_complexity(sequence_length=1000):
     # Вычисляем профиль
     profile = calculate_complexity_profile(binary_sequence)
 
-    # Создаем график
-    plt.figure(figsize=(12, 6))
-
-    # График профиля линейной сложности
-    x = range(1, len(profile) + 1)
-    plt.plot(x, profile, 'b-', label='Профиль линейной сложности')
-
-    # Идеальная линия N/2
-    plt.plot(x, [n / 2 for n in x], 'r--', label='Идеальная линия (N/2)')
-
-    plt.title('Профиль линейной сложности')
-    plt.xlabel('Длина подпоследовательности (N)')
-    plt.ylabel('Линейная сложность (L)')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-
-    plt.savefig(f'linear_complexity_{sequence_length}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    output('linear_complexity', f'linear_complexity_{sequence_length}', plot, save,
+           profile=profile)
 
     # Анализ результатов
     print(f"\nАнализ профиля линейной сложности:")
@@ -101,11 +58,27 @@ def test_linear_complexity(sequence_length=1000):
     print(f"Конечная линейная сложность: {profile[-1]}")
 
     # Вычисляем отклонение от идеальной линии
-    ideal_line = [n / 2 for n in x]
-    mean_deviation = np.mean([abs(p - i) for p, i in zip(profile, ideal_line)])
+    ideal_line = np.arange(1, len(profile) + 1) / 2
+    mean_deviation = float(np.mean(np.abs(np.asarray(profile) - ideal_line)))
     print(f"Среднее отклонение от идеальной линии: {mean_deviation:.2f}")
 
+    return {
+        'bits': len(binary_sequence),
+        'profile': profile,
+        'linear_complexity': int(profile[-1]),
+        'mean_deviation': mean_deviation,
+    }
+
+
+def test_linear_complexity():
+    """Проверка для pytest без графиков: профиль не убывает и растет не быстрее длины"""
+    result = run_linear_complexity(plot=False)
+    profile = result['profile']
+    assert len(profile) == result['bits']
+    assert np.all(np.diff(profile) >= 0)
+    assert np.all(profile <= np.arange(1, len(profile) + 1))
+
 
 if __name__ == "__main__":
     # Тестируем с меньшей длиной последовательности для начала
-    test_linear_complexity(100)  # для демонстрации
\ No newline at end of file
+    run_linear_complexity(100)  # для демонстрации
\ No newline at end of file
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from srs.mcg import MCG, create_generators
+
+# Генератор из задания, генератор с приращением и генератор с модулем не степени двойки
+PARAMS = [
+    (2 ** 31, 11, 0, 11),
+    (2 ** 31, 1103515245, 12345, 42),
+    (2 ** 31 - 1, 16807, 0, 1),
+    (1000, 21, 7, 3),
+]
+
+
+def scan(params, count, start=None):
+    """Первые count значений next() (при start - от состояния start)"""
+    generator = MCG(*params)
+    if start is not None:
+        generator.current = start
+    return [generator.next() for _ in range(count)]
+
+
+@pytest.mark.parametrize('params', PARAMS)
+@pytest.mark.parametrize('block_size', [1, 2, 7, 64, 4096])
+def test_generate_block_matches_next(params, block_size):
+    generator = MCG(*params)
+    reference = scan(params, 1000)
+    block = generator.generate_block(1000, block_size)
+    assert block.tolist() == reference
+    assert generator.current == reference[-1]
+
+
+@pytest.mark.parametrize('params', PARAMS)
+def test_generate_block_continues_state(params):
+    generator = MCG(*params)
+    parts = [generator.generate_block(size, block_size=5) for size in (0, 3, 17, 1, 100)]
+    assert np.concatenate(parts).tolist() == scan(params, 121)
+
+
+@pytest.mark.parametrize('params', PARAMS)
+def test_generate_sequence_matches_next(params):
+    assert MCG(*params).generate_sequence(200) == scan(params, 200)
+
+
+@pytest.mark.parametrize('params', PARAMS)
+@pytest.mark.parametrize('chunk_size', [1, 10, 333, 1000, 5000])
+def test_iter_chunks_matches_next(params, chunk_size):
+    generator = MCG(*params)
+    chunks = [chunk.copy() for chunk in generator.iter_chunks(chunk_size, total=1000, block_size=16)]
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert np.concatenate(chunks).tolist() == scan(params, 1000)
+    assert generator.current == scan(params, 1000)[-1]
+
+
+def test_iter_chunks_infinite_stream():
+    generator = create_generators()
+    stream = generator.iter_chunks(100)
+    values = np.concatenate([next(stream).copy() for _ in range(5)])
+    assert values.tolist() == scan((2 ** 31, 11, 0, 11), 500)
+
+
+@pytest.mark.parametrize('params', PARAMS)
+def test_jump_skip_element_at_match_scan(params):
+    reference = [params[3]] + scan(params, 300)  # reference[n] - состояние после n шагов
+    generator = MCG(*params)
+    for n in (0, 1, 2, 57, 299):
+        assert generator.element_at(n) == reference[n + 1]
+        generator.jump(n)
+        assert generator.current == reference[n]
+        generator.reset(n)
+        assert generator.next() == reference[n + 1]
+
+    generator.reset()
+    generator.skip(10)
+    generator.skip(0)
+    generator.skip(25)
+    assert generator.current == reference[35]
+    assert generator.current == MCG(*params).element_at(34)
+
+
+def test_jump_far_ahead_matches_scan_from_period():
+    # 2^31, a = 11: период 2^29, поэтому элемент 2^29 + n совпадает с элементом n
+    generator = create_generators()
+    assert generator.element_at(2 ** 29 + 5) == generator.element_at(5)
+    generator.jump(2 ** 40)
+    assert generator.current == create_generators().element_at(2 ** 40 - 1)
+
+
+def test_negative_steps_rejected():
+    generator = create_generators()
+    with pytest.raises(ValueError):
+        generator.element_at(-1)
+    with pytest.raises(ValueError):
+        generator.jump(-1)
+    with pytest.raises(ValueError):
+        generator.skip(-5)
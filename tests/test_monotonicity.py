@@ -1,105 +1,85 @@
-import matplotlib
-
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
-from srs.mcg import create_generators
+from srs.cache import cached_sequence
+from srs.plotting import output
+from srs.runs import run_length_histograms
 
 
 def find_monotonic_sequences(numbers):
     """
     Находит длины последовательных участков возрастания и убывания
-    Возвращает два списка длин: для возрастающих и убывающих участков
+    Возвращает гистограммы длин для возрастающих и убывающих участков
+    и накопитель со статистиками критериев серий
     """
-    increasing_lengths = []
-    decreasing_lengths = []
-
-    current_length = 1
-    current_increasing = None
-
-    for i in range(1, len(numbers)):
-        if current_increasing is None:
-            current_increasing = numbers[i] > numbers[i - 1]
-            continue
-
-        if current_increasing and numbers[i] > numbers[i - 1]:
-            current_length += 1
-        elif not current_increasing and numbers[i] < numbers[i - 1]:
-            current_length += 1
-        else:
-            # Сохраняем длину предыдущего участка
-            if current_increasing:
-                increasing_lengths.append(current_length)
-            else:
-                decreasing_lengths.append(current_length)
-            # Начинаем новый участок
-            current_length = 2
-            current_increasing = not current_increasing
-
-    # Добавляем последний участок
-    if current_increasing:
-        increasing_lengths.append(current_length)
-    else:
-        decreasing_lengths.append(current_length)
-
-    return increasing_lengths, decreasing_lengths
-
-
-def test_monotonicity(sequence_length=10000):
+    return run_length_histograms(numbers)
+
+
+def _mean_length(histogram):
+    """Средняя длина участка по гистограмме длин"""
+    return np.arange(len(histogram)) @ histogram / histogram.sum()
+
+
+def run_monotonicity(sequence_length=10000, plot=None, save=False):
     """
     Выполняет тест на монотонность для последовательности
+
+    Args:
+        plot: строить график (None - если не задана переменная MCG_NO_PLOT)
+        save: сохранить массивы графика в .npz для отложенной отрисовки
+    Returns:
+        словарь результатов RunsAccumulator.result()
     """
-    generator = create_generators()
-    sequence = generator.generate_sequence(sequence_length)
+    sequence = cached_sequence(sequence_length)
 
-    # Находим участки возрастания и убывания
-    increasing_lengths, decreasing_lengths = find_monotonic_sequences(sequence)
+    # Находим участки возрастания и убывания (гистограммы длин за один проход)
+    increasing, decreasing, runs = find_monotonic_sequences(sequence)
 
     # Статистика
     print(f"\nАнализ монотонности (длина последовательности: {sequence_length}):")
-    print(f"Количество участков возрастания: {len(increasing_lengths)}")
-    print(f"Количество участков убывания: {len(decreasing_lengths)}")
-    print(f"Средняя длина участка возрастания: {np.mean(increasing_lengths):.2f}")
-    print(f"Средняя длина участка убывания: {np.mean(decreasing_lengths):.2f}")
-    print(f"Максимальная длина участка возрастания: {max(increasing_lengths)}")
-    print(f"Максимальная длина участка убывания: {max(decreasing_lengths)}")
-
-    # Создаем гистограммы
-    plt.figure(figsize=(15, 6))
-
-    # Гистограмма длин участков возрастания
-    plt.subplot(1, 2, 1)
-    plt.hist(increasing_lengths, bins='auto', density=True, alpha=0.7)
-    plt.title('Распределение длин участков возрастания')
-    plt.xlabel('Длина участка')
-    plt.ylabel('Частота')
-    plt.grid(True, alpha=0.3)
-
-    # Гистограмма длин участков убывания
-    plt.subplot(1, 2, 2)
-    plt.hist(decreasing_lengths, bins='auto', density=True, alpha=0.7)
-    plt.title('Распределение длин участков убывания')
-    plt.xlabel('Длина участка')
-    plt.ylabel('Частота')
-    plt.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.savefig(f'monotonicity_analysis_{sequence_length}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    print(f"Количество участков возрастания: {increasing.sum()}")
+    print(f"Количество участков убывания: {decreasing.sum()}")
+    print(f"Средняя длина участка возрастания: {_mean_length(increasing):.2f}")
+    print(f"Средняя длина участка убывания: {_mean_length(decreasing):.2f}")
+    print(f"Максимальная длина участка возрастания: {len(increasing) - 1}")
+    print(f"Максимальная длина участка убывания: {len(decreasing) - 1}")
+
+    # Гистограммы длин участков возрастания и убывания
+    output('monotonicity', f'monotonicity_analysis_{sequence_length}', plot, save,
+           increasing=increasing, decreasing=decreasing)
 
     # Дополнительная проверка - распределение длин должно быть убывающим
     # для действительно случайной последовательности
     print("\nПроверка распределения длин:")
 
-    for length in range(2, max(max(increasing_lengths), max(decreasing_lengths))):
-        inc_count = sum(1 for x in increasing_lengths if x == length)
-        dec_count = sum(1 for x in decreasing_lengths if x == length)
-        if inc_count > 0 or dec_count > 0:
-            print(f"Длина {length}:")
-            print(f"  Участки возрастания: {inc_count} раз")
-            print(f"  Участки убывания: {dec_count} раз")
+    max_length = max(len(increasing), len(decreasing)) - 1
+    increasing = np.pad(increasing, (0, max_length + 1 - len(increasing)))
+    decreasing = np.pad(decreasing, (0, max_length + 1 - len(decreasing)))
+    for length in np.flatnonzero(increasing[2:max_length] + decreasing[2:max_length]) + 2:
+        print(f"Длина {length}:")
+        print(f"  Участки возрастания: {increasing[length]} раз")
+        print(f"  Участки убывания: {decreasing[length]} раз")
+
+    # Критерии серий
+    total_runs, z, p_value = runs.up_down_test()
+    print(f"\nКритерий серий вверх и вниз (Вальд-Вольфовиц):")
+    print(f"Число участков: {total_runs}, ожидается {(2 * sequence_length - 1) / 3:.1f}")
+    print(f"Z-статистика: {z:.4f}")
+    print(f"P-значение: {p_value:.4f}")
+
+    v, p_value = runs.knuth_runs_up_test()
+    print(f"\nКритерий серий вверх (Кнут):")
+    print(f"Статистика V (6 степеней свободы): {v:.4f}")
+    print(f"P-значение: {p_value:.4f}")
+
+    return runs.result()
+
+
+def test_monotonicity():
+    """Проверка для pytest без графиков: p-значения критериев серий в [0, 1]"""
+    result = run_monotonicity(plot=False)
+    assert 0 <= result['up_down_p_value'] <= 1
+    assert 0 <= result['knuth_p_value'] <= 1
 
 
 if __name__ == "__main__":
-    test_monotonicity(10000)
-    test_monotonicity(100000)
\ No newline at end of file
+    run_monotonicity(10000)
+    run_monotonicity(100000)
@@ -0,0 +1,43 @@
+import gc
+
+import numpy as np
+import pytest
+
+from srs.mcg import MCG
+from srs.parallel import generate_parallel, partition
+
+
+@pytest.mark.parametrize('length, chunks', [(10, 1), (10, 3), (1000, 7), (5, 10)])
+def test_partition_covers_range(length, chunks):
+    parts = partition(length, chunks)
+    assert parts[0][0] == 0 and parts[-1][1] == length
+    assert all(stop == start for (_, stop), (start, _) in zip(parts, parts[1:]))
+    assert all(start < stop for start, stop in parts)
+
+
+@pytest.mark.parametrize('params', [(2 ** 31, 11, 0, 11), (2 ** 64, 6364136223846793005, 1, 7),
+                                    (2 ** 31 - 1, 16807, 0, 1)])
+@pytest.mark.parametrize('workers, chunks', [(1, None), (2, None), (2, 5)])
+def test_generate_parallel_matches_serial(params, workers, chunks):
+    generator, serial = MCG(*params), MCG(*params)
+    generator.skip(123)
+    serial.skip(123)
+
+    values = generate_parallel(generator, 10007, workers=workers, chunks=chunks, block_size=64)
+    assert np.array_equal(values, serial.generate_block(10007))
+    assert generator.current == serial.current
+
+
+def test_generate_parallel_result_outlives_views():
+    values = generate_parallel(MCG(2 ** 31, 11, 0, 11), 1000, workers=2)
+    view = values[100:110]
+    expected = view.tolist()
+    del values
+    gc.collect()
+    assert view.tolist() == expected
+
+
+def test_generate_parallel_empty():
+    generator = MCG(2 ** 31, 11, 0, 11)
+    assert len(generate_parallel(generator, 0)) == 0
+    assert generator.current == 11
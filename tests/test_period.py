@@ -0,0 +1,64 @@
+import pytest
+
+from srs.mcg import MCG
+from srs.period import CycleStructure, factorize, sequence_period
+
+
+def enumerate_period(N, a, c, x0):
+    """Предпериод и период перебором значений x0, x1, ... до первого повтора"""
+    seen = {}
+    x = x0 % N
+    index = 0
+    while x not in seen:
+        seen[x] = index
+        x = (a * x + c) % N
+        index += 1
+    return CycleStructure(seen[x], index - seen[x])
+
+
+MODULI = [1, 2, 16, 64, 2 ** 10, 3 * 5 * 7, 2 ** 3 * 3 ** 2 * 5, 97, 1000, 2 * 3 ** 4 * 7]
+
+
+@pytest.mark.parametrize('N', MODULI)
+def test_sequence_period_matches_enumeration(N):
+    for a in {0, 1, 2, 3, 5, 6, 11, 21, N - 1, N + 1}:
+        for c in {0, 1, 3, N // 2}:
+            for x0 in {0, 1, 2, 6, N - 1, N + 3}:
+                assert sequence_period(N, a, c, x0) == enumerate_period(N, a, c, x0), (N, a, c, x0)
+
+
+def test_task_generator_period():
+    # N = 2^31, a = x0 = 11: порядок 11 по модулю 2^31 равен 2^29
+    assert MCG(2 ** 31, 11, 0, 11).period() == CycleStructure(0, 2 ** 29)
+
+
+def test_large_modulus_period_without_generation():
+    N = 2 ** 61 - 1  # простое: период a = 37 равен порядку 37 по модулю N
+    period = sequence_period(N, 37, 0, 5).period
+    assert pow(37, period, N) == 1
+    assert all(pow(37, period // q, N) != 1 for q in factorize(period))
+
+
+@pytest.mark.parametrize('n', [1, 2, 97, 2 ** 10, 3 ** 5 * 7 ** 2, 600851475143, 2 ** 61 - 1])
+def test_factorize(n):
+    factors = factorize(n)
+    product = 1
+    for p, e in factors.items():
+        product *= p ** e
+    assert product == n
+
+
+def test_length_check_warns_for_short_period():
+    generator = MCG(2 ** 4, 5, 0, 3)  # период 4
+    with pytest.warns(RuntimeWarning, match="период 4"):
+        generator.generate_block(10)
+
+
+def test_length_check_skips_factoring_large_composite_modulus(recwarn):
+    # 88-битный составной модуль: period() потребовал бы долгого разложения
+    N = 17592186044423 * 17592186044437
+    generator = MCG(N, 5, 0, 3)
+    reference = MCG(N, 5, 0, 3)
+    assert generator.generate_sequence(10) == [reference.next() for _ in range(10)]
+    assert generator._cycle is None
+    assert not recwarn.list
@@ -0,0 +1,41 @@
+import os
+import runpy
+
+import pytest
+
+from srs.plotting import PLOTTERS, render
+
+TESTS_DIR = os.path.dirname(__file__)
+
+# Скрипт анализа, его функция run_*, аргументы и вид графика
+SCRIPTS = [
+    ('test_histogram.py', 'run_histogram_distribution', {'sample_size': 2000}, 'histogram'),
+    ('test_ autocorrelation_func.py', 'run_autocorrelation', {'sequence_length': 2000},
+     'autocorrelation'),
+    ('test_linear_profile.py', 'run_linear_complexity', {'sequence_length': 100},
+     'linear_complexity'),
+    ('test_monotonicity.py', 'run_monotonicity', {'sequence_length': 2000}, 'monotonicity'),
+    ('test_series.py', 'run_series', {'sequence_length': 500}, 'series'),
+    ('test_scatter_plot.py', 'run_plane_distribution', {'sequence_length': 500}, 'plane'),
+    ('test_scatter_plot.py', 'run_plane_distribution_binned',
+     {'sequence_length': 5000, 'bins': 16}, 'heatmap'),
+    ('test_scatter_plot.py', 'run_plane_distribution_binned',
+     {'sequence_length': 5000, 'bins': 8, 'dimension': 3}, 'heatmap'),
+]
+
+
+def test_every_plot_kind_is_covered():
+    assert {kind for *_, kind in SCRIPTS} == set(PLOTTERS)
+
+
+@pytest.mark.parametrize('script, function, kwargs, kind', SCRIPTS)
+def test_render_saved_arrays(tmp_path, monkeypatch, script, function, kwargs, kind):
+    pytest.importorskip('matplotlib')
+    monkeypatch.chdir(tmp_path)
+    runpy.run_path(os.path.join(TESTS_DIR, script))[function](**kwargs, plot=False, save=True)
+
+    saved, = tmp_path.glob('*.npz')
+    assert not list(tmp_path.glob('*.png'))
+    image = render(str(saved))
+    assert image == str(saved.with_suffix('.png'))
+    assert os.path.getsize(image) > 0
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from srs import profiling
+from srs.profiling import profiled, stage
+
+MIB = 2 ** 20
+
+
+@pytest.fixture
+def profile():
+    """Включает замеры на время теста и восстанавливает прежнее состояние"""
+    enabled, memory = profiling._State.enabled, profiling._State.memory
+    saved = profiling.stats()
+    profiling.disable()
+    profiling.reset()
+    yield profiling
+    profiling.disable()
+    profiling.reset()
+    profiling._State.stats.update(saved)
+    if enabled:
+        profiling.enable(memory)
+
+
+@profiled(name='process', count='values')
+def process(values, scale=1):
+    return values
+
+
+def test_nested_peak_is_attributed_to_inner_and_outer(profile):
+    profile.enable(memory=True)
+    with stage('outer'):
+        with stage('inner'):
+            block = bytearray(8 * MIB)
+            del block
+        with stage('sibling'):
+            small = bytearray(MIB // 4)
+            del small
+    stats = profile.stats()
+    assert stats['inner'].peak_memory >= 8 * MIB
+    assert stats['outer'].peak_memory >= stats['inner'].peak_memory
+    # Пик предыдущего этапа не переносится на соседний
+    assert MIB // 4 <= stats['sibling'].peak_memory < 8 * MIB
+
+
+@pytest.mark.parametrize('argument, expected', [(1000, 1000), (np.int64(70), 70),
+                                                (np.arange(25), 25), ([1, 2, 3], 3)])
+def test_count_argument(profile, argument, expected):
+    profile.enable()
+    process(argument)
+    process(values=argument, scale=2)
+    stats = profile.stats()['process']
+    assert (stats.calls, stats.values) == (2, 2 * expected)
+
+
+def test_add_values_and_throughput(profile):
+    profile.enable()
+    with stage('chunks') as current:
+        current.add_values(10)
+        current.add_values(5)
+    stats = profile.stats()['chunks']
+    assert stats.values == 15 and stats.throughput > 0
+
+
+def test_disabled_path_records_nothing(profile):
+    assert stage('ignored', values=10) is profiling._NULL_STAGE
+    with stage('ignored') as current:
+        current.add_values(10)
+    assert process(np.arange(5)).tolist() == list(range(5))
+    assert profile.stats() == {}
+
+
+def test_json_round_trip(profile, tmp_path):
+    profile.enable(memory=True)
+    with stage('outer', values=100):
+        process(np.arange(50))
+    path = tmp_path / 'profile.json'
+    profile.save_json(path)
+    assert profile.load_json(path) == profile.stats()
+    assert 'outer' in profile.summary()
@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+import pytest
+
+from srs import battery as battery_module
+from srs.mcg import MCG
+from srs.results import (TABLE_COLUMNS, GeneratorParams, Statistic, TestResult as Result,
+                         read_jsonl, read_npz, to_table, write_jsonl, write_npz)
+
+
+@pytest.fixture(scope='module')
+def records():
+    battery = battery_module.TestBattery(MCG(2 ** 31, 11, 0, 11), chunk_size=1000)
+    return battery.records(battery.run(3000), offset=5)
+
+
+def test_records_cover_battery_tests(records):
+    assert [record.test for record in records] == list(battery_module.TESTS)
+    for record in records:
+        assert record.sample_size == 3000
+        assert record.generator == GeneratorParams(2 ** 31, 11, 0, 11, 5)
+        assert all(type(statistic.value) in (int, float) for statistic in record.statistics)
+
+
+def test_jsonl_round_trip(tmp_path, records):
+    path = tmp_path / 'results.jsonl'
+    write_jsonl(records[:2], path)
+    write_jsonl(records[2:], path)
+    assert read_jsonl(path) == records
+
+    write_jsonl(records[:1], path, append=False)
+    assert read_jsonl(path) == records[:1]
+
+
+def test_table_dtypes_and_npz_round_trip(tmp_path, records):
+    table = to_table(records)
+    assert tuple(table) == TABLE_COLUMNS
+    rows = sum(len(record.statistics) for record in records)
+    assert all(len(column) == rows for column in table.values())
+    for column in ('N', 'a', 'c', 'x0', 'offset'):
+        assert table[column].dtype == np.uint64
+    for column in ('test', 'statistic', 'parameters'):
+        assert table[column].dtype.kind == 'U'
+    for column in ('sample_size', 'degrees_of_freedom'):
+        assert table[column].dtype == np.int64
+    for column in ('value', 'p_value', 'elapsed', 'created'):
+        assert table[column].dtype == np.float64
+
+    path = tmp_path / 'results.npz'
+    write_npz(records, path)
+    loaded = read_npz(path)
+    assert loaded.keys() == table.keys()
+    for column, values in table.items():
+        assert loaded[column].dtype == values.dtype
+        assert np.array_equal(loaded[column], values, equal_nan=values.dtype.kind == 'f')
+
+
+def test_missing_p_value_and_degrees_of_freedom():
+    result = Result('acf', 10, GeneratorParams(16, 5, 1, 3), [Statistic('max_abs_acf', 0.5)])
+    table = to_table([result])
+    assert math.isnan(table['p_value'][0])
+    assert table['degrees_of_freedom'][0] == -1
+
+
+def test_wide_parameters_fall_back_to_strings(tmp_path):
+    N = 2 ** 100
+    results = [Result('acf', 10, GeneratorParams(N, 2 ** 99 + 5, 3, 1, 2 ** 64),
+                      [Statistic('max_abs_acf', 0.25)]),
+               Result('acf', 10, GeneratorParams(2 ** 31, 11, 0, 11), [Statistic('max_abs_acf', 0.5)])]
+    table = to_table(results)
+    assert table['N'].dtype.kind == 'U' and table['N'].tolist() == [str(N), str(2 ** 31)]
+    assert table['offset'].tolist() == [str(2 ** 64), '0']
+    assert table['x0'].dtype == np.uint64
+
+    path = tmp_path / 'wide.jsonl'
+    write_jsonl(results, path)
+    assert read_jsonl(path) == results
+    write_npz(results, tmp_path / 'wide.npz')
+    assert read_npz(tmp_path / 'wide.npz')['a'].tolist() == [str(2 ** 99 + 5), '11']
+
+
+def test_empty_run_produces_records():
+    battery = battery_module.TestBattery(MCG(2 ** 31, 11, 0, 11))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        records = battery.records(battery.run(0))
+    assert [record.sample_size for record in records] == [0] * len(battery_module.TESTS)
+    assert math.isnan(records[0].statistic('chi_square').value)
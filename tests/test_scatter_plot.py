@@ -1,56 +1,34 @@
-import matplotlib
-
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
+from srs.cache import cached_sequence
 from srs.mcg import create_generators
+from srs.plane import PlaneAccumulator
+from srs.plotting import output
 
 
-def test_plane_distribution(sequence_length=1000):
+def run_plane_distribution(sequence_length=1000, plot=None, save=False):
     """
     Тест распределения точек на плоскости согласно методике 4.1.2
     Args:
         sequence_length: длина последовательности n
+        plot: строить график (None - если не задана переменная MCG_NO_PLOT)
+        save: сохранить массивы графика в .npz для отложенной отрисовки
+    Returns:
+        словарь с числом точек и коэффициентом корреляции
     """
-    # Создаем генератор
-    generator = create_generators()
-
     # Получаем параметры
     R = 31  # разрядность для N = 2^31
     field_size = 2 ** R - 1  # размер поля
 
     # Генерируем последовательность
-    sequence = generator.generate_sequence(sequence_length)
+    sequence = cached_sequence(sequence_length)
 
     # Создаем пары точек (εᵢ, εᵢ₊₁)
     x_coords = sequence[:-1]  # все элементы кроме последнего
     y_coords = sequence[1:]  # все элементы кроме первого
 
-    # Создаем график
-    plt.figure(figsize=(12, 12))
-
-    # Основной график разброса точек
-    plt.scatter(x_coords, y_coords, alpha=0.5, s=1)
-
-    # Добавляем сетку
-    plt.grid(True, alpha=0.3)
-
-    # Добавляем подписи
-    plt.title(
-        f'Распределение на плоскости\nДлина последовательности: {sequence_length}, Размер поля: {field_size}x{field_size}')
-    plt.xlabel('εᵢ')
-    plt.ylabel('εᵢ₊₁')
-
-    # Устанавливаем одинаковый масштаб по осям
-    plt.axis('equal')
-
-    # Устанавливаем пределы осей от 0 до field_size
-    plt.xlim(0, field_size)
-    plt.ylim(0, field_size)
-
-    # Сохраняем график
-    plt.savefig(f'plane_distribution_correct_{sequence_length}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    # Точечный график пар
+    output('plane', f'plane_distribution_correct_{sequence_length}', plot, save,
+           x=x_coords, y=y_coords, field_size=field_size, sequence_length=sequence_length)
 
     # Статистический анализ
     print(f"\nСтатистический анализ распределения на плоскости:")
@@ -62,8 +40,68 @@ def test_plane_distribution(sequence_length=1000):
     correlation = np.corrcoef(x_coords, y_coords)[0, 1]
     print(f"\nКоэффициент корреляции между εᵢ и εᵢ₊₁: {correlation:.4f}")
 
+    return {'points': len(x_coords), 'correlation': float(correlation)}
+
+
+def run_plane_distribution_binned(sequence_length=100000, bins=256, dimension=2,
+                                   chunk_size=2 ** 20, plot=None, save=False):
+    """
+    Распределение пар (тройки при dimension=3) в виде сетки счетчиков
+
+    Точки накапливаются блоками в сетку bins x bins (x bins), поэтому время
+    отрисовки и размер изображения не зависят от длины последовательности
+    Args:
+        sequence_length: длина последовательности n
+        bins: разрешение сетки по каждой оси
+        dimension: 2 - пары (εᵢ, εᵢ₊₁), 3 - тройки (εᵢ, εᵢ₊₁, εᵢ₊₂)
+        plot: строить график (None - если не задана переменная MCG_NO_PLOT)
+        save: сохранить сетку счетчиков в .npz для отложенной отрисовки
+    Returns:
+        словарь результатов PlaneAccumulator.result()
+    """
+    generator = create_generators()
+    accumulator = PlaneAccumulator(generator.N, bins, dimension)
+    for chunk in generator.iter_chunks(chunk_size, total=sequence_length):
+        accumulator.update(chunk)
+    result = accumulator.result()
+
+    # Тепловая карта сетки (для троек - срезы куба)
+    suffix = '' if dimension == 2 else '3d_'
+    output('heatmap', f'heatmap_distribution_{suffix}{sequence_length}', plot, save,
+           counts=accumulator.counts, sequence_length=sequence_length)
+
+    # Статистический анализ
+    print(f"\nРаспределение по сетке {bins}^{dimension} (длина последовательности: {sequence_length}):")
+    print(f"Количество точек: {result['points']}")
+    print(f"Пустых ячеек: {result['empty_cells']} из {accumulator.counts.size}")
+    print(f"Хи-квадрат статистика: {result['chi_square']:.4f} "
+          f"({accumulator.counts.size - 1} степеней свободы)")
+    print(f"P-значение: {result['chi_square_p_value']:.4f}")
+    print(f"Коэффициент корреляции между εᵢ и εᵢ₊₁: {result['correlation']:.4f}")
+
+    return result
+
+
+def test_plane_distribution():
+    """Проверка для pytest без графиков: n - 1 пар, корреляция в [-1, 1]"""
+    result = run_plane_distribution(plot=False)
+    assert result['points'] == 1000 - 1
+    assert -1 <= result['correlation'] <= 1
+
+
+def test_plane_distribution_binned():
+    """Проверка для pytest без графиков: в сетку попали все пары"""
+    result = run_plane_distribution_binned(plot=False)
+    assert result['points'] == 100000 - 1
+    assert 0 <= result['chi_square_p_value'] <= 1
+
 
 if __name__ == "__main__":
     # Тестируем с разными длинами последовательности
-    test_plane_distribution(1000)
-    test_plane_distribution(10000)
\ No newline at end of file
+    run_plane_distribution(1000)
+    run_plane_distribution(10000)
+
+    # Сетка счетчиков вместо отдельных точек
+    run_plane_distribution_binned(5000)
+    run_plane_distribution_binned(50000)
+    run_plane_distribution_binned(10 ** 7, bins=64, dimension=3)
\ No newline at end of file
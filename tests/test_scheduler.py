@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from srs import battery as battery_module
+from srs.mcg import MCG
+from srs.scheduler import run_matrix
+
+TESTS = ['histogram', 'acf', 'series', 'runs', 'plane', 'linear_complexity']
+
+
+def test_run_matrix_matches_battery():
+    params = (2 ** 31, 1103515245, 12345, 42)
+    records = run_matrix(TESTS, [500, 3000], generator=MCG(*params), offset=17, workers=2,
+                         chunk_size=700, memory=False, verbose=False)
+    assert [(record.test, record.sample_size) for record in records] == \
+        [(test, size) for test in TESTS for size in (500, 3000)]
+
+    for size in (500, 3000):
+        generator = MCG(*params)
+        generator.jump(17)
+        battery = battery_module.TestBattery(generator, TESTS, chunk_size=700)
+        expected = battery.records(battery.run(size), offset=17)
+        actual = [record.test_result for record in records if record.sample_size == size]
+        assert len(actual) == len(expected)
+        for result, reference in zip(actual, expected):
+            assert (result.test, result.sample_size, result.generator) == \
+                (reference.test, reference.sample_size, reference.generator)
+            for statistic, expected_statistic in zip(result.statistics, reference.statistics):
+                assert statistic.name == expected_statistic.name
+                assert np.isclose(statistic.value, expected_statistic.value, rtol=1e-9, equal_nan=True)
+
+
+def test_shared_block_counts_against_memory_budget():
+    with pytest.raises(ValueError, match="memory_budget"):
+        run_matrix(['acf'], [10000], memory_budget=8 * 10000, verbose=False)
@@ -0,0 +1,48 @@
+import itertools
+import math
+
+import pytest
+
+from srs.spectral import HERMITE_POWERS, dual_basis, lll_reduce, spectral_test
+
+
+def brute_force_nu_squared(a, N, t):
+    """
+    Минимум s_1^2 + ... + s_t^2 по ненулевым s с s_1 + a s_2 + ... + a^(t-1) s_t = 0 mod N
+    перебором s_2..s_t в пределах оценки Эрмита (s_1 - наименьший по модулю вычет)
+    """
+    bound = math.isqrt(int(HERMITE_POWERS[t] ** (1 / t) * N ** (2 / t)) + 1)
+    powers = [pow(a, j, N) for j in range(1, t)]
+    best = N * N  # вектор (N, 0, ..., 0)
+    for rest in itertools.product(range(-bound, bound + 1), repeat=t - 1):
+        s1 = -sum(p * s for p, s in zip(powers, rest)) % N
+        s1 = min(s1, N - s1)
+        norm = s1 * s1 + sum(s * s for s in rest)
+        if norm:
+            best = min(best, norm)
+    return best
+
+
+@pytest.mark.parametrize('a, N', [(11, 2 ** 10), (5, 2 ** 10), (37, 2 ** 10), (77, 2 ** 12),
+                                  (3, 2 ** 9), (16807, 2 ** 13 - 1), (137, 256)])
+def test_nu_squared_matches_brute_force(a, N):
+    for result in spectral_test(a, N, dimensions=range(2, 5)):
+        assert result.nu_squared == brute_force_nu_squared(a, N, result.dimension)
+
+
+@pytest.mark.parametrize('t', [2, 3, 5])
+def test_shortest_vector_lies_in_dual_lattice(t):
+    a, N = 1103515245, 2 ** 31
+    result, = spectral_test(a, N, dimensions=[t])
+    assert sum(s * pow(a, j, N) for j, s in enumerate(result.vector)) % N == 0
+    assert sum(s * s for s in result.vector) == result.nu_squared
+    assert 0 < result.score <= 1
+
+
+def test_lll_keeps_lattice_determinant():
+    basis = dual_basis(11, 2 ** 31, 3)
+    reduced = lll_reduce(basis)
+    determinant = lambda m: (m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+                             - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+                             + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0]))
+    assert abs(determinant(reduced)) == abs(determinant(basis)) == 2 ** 31